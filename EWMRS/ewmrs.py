@@ -16,7 +16,7 @@ if __name__ == "__main__" and __package__ is None:
 from EWMRS.ingest.mrms.main import download_all_files
 from EWMRS.ingest.wpc.main import run_wpc_ingest
 from EWMRS.render.tools import TransformUtils
-from EWMRS.render.render import GUILayerRenderer
+from EWMRS.render.render import GUILayerRenderer, read_index, write_index
 from EWMRS.render.config import file_list
 from EWMRS.util import file as fs
 from EWMRS.util.io import IOManager, TimestampedOutput, QueueWriter
@@ -132,16 +132,13 @@ def cleanup_old_gui_files(max_age_minutes: int = 120):
         index_file = out_dir / "index.json"
         if index_file.exists():
             try:
-                import json
-                with open(index_file, 'r') as f:
-                    timestamps = json.load(f)
+                timestamps = read_index(index_file)
                 
                 # Keep only timestamps that have corresponding PNG files
                 existing_pngs = {p.stem.split('_')[-1] for p in out_dir.glob("*.png")}
                 timestamps = [ts for ts in timestamps if ts in existing_pngs]
                 
-                with open(index_file, 'w') as f:
-                    json.dump(timestamps, f)
+                write_index(index_file, timestamps)
             except Exception as e:
                 io_manager.write_warning(f"Failed to update index.json in {out_dir}: {e}")
     
@@ -168,9 +165,10 @@ def run_render_pipeline(dt, max_entries: int = 10, download: bool = True) -> Dic
         except Exception as e:
             io_manager.write_error(f"Download step failed: {e}")
 
-    # Render layers in parallel using separate processes (true multi-core)
-    io_manager.write_info(f"Rendering {len(file_list)} layers across 4 CPU cores...")
-    with ProcessPoolExecutor(max_workers=4) as executor:
+    # Render layers in parallel using separate processes (true multi-core), one per layer up to the CPU count
+    workers = max(1, min(len(file_list), os.cpu_count() or 1))
+    io_manager.write_info(f"Rendering {len(file_list)} layers across {workers} CPU cores...")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
         futures = {executor.submit(_render_layer, layer): layer for layer in file_list}
         for future in as_completed(futures):
             name, png_path = future.result()
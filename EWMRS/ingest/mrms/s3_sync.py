@@ -16,7 +16,17 @@ from EWMRS.ingest.mrms.timestamp_utils import round_to_nearest_even_minute
 
 @lru_cache(maxsize=1)
 def _get_unsigned_s3_client():
-    return boto3.client('s3', config=Config(signature_version=UNSIGNED))
+    # The client is shared across threads; size its connection pool so concurrent
+    # listings and downloads don't queue on botocore's default of 10 connections
+    max_pool_connections = max(16, (os.cpu_count() or 1) * 5)
+    return boto3.client('s3', config=Config(signature_version=UNSIGNED, max_pool_connections=max_pool_connections))
+
+
+@lru_cache(maxsize=None)
+def _get_list_paginator(client):
+    # get_paginator builds a fresh paginator class on every call; paginate() keeps its
+    # state in the page iterator it returns, so one paginator per client is shared
+    return client.get_paginator('list_objects_v2')
 
 
 _DECOMPRESS_CHUNK_SIZE = 1024 * 1024  # 1MB chunks to reduce syscall overhead during gzip copy
@@ -30,7 +40,7 @@ class FileFinder:
         self.max_entries = max_entries  # Maximum number of entries to return
         self.io_manager = io_manager # Use the IOManager class in util.io
         self.client = client if client is not None else _get_unsigned_s3_client()
-        self.paginator = self.client.get_paginator('list_objects_v2')
+        self.paginator = _get_list_paginator(self.client)
     
     def lookup_files(self, modifier, verbose=False):
         """
@@ -3,6 +3,10 @@ Timestamp utilities for MRMS data processing.
 """
 import datetime
 
+# Possible offsets (seconds) from the zeroed minute to the rounded even minute
+_ROUND_UP_SECONDS = 120
+_OFFSETS = {seconds: datetime.timedelta(seconds=seconds) for seconds in (-60, 0, 60, 120)}
+
 
 def round_to_nearest_even_minute(ts: datetime.datetime) -> datetime.datetime:
     """
@@ -10,8 +14,8 @@ def round_to_nearest_even_minute(ts: datetime.datetime) -> datetime.datetime:
     
     Examples:
         23:59:30 → 00:00:00 (next day if at midnight boundary)
-        23:59:00 → 00:00:00
-        23:58:59 → 23:58:00
+        23:59:00 → 23:58:00
+        23:58:29 → 23:58:00
         23:57:30 → 23:58:00
         23:56:00 → 23:56:00
     
@@ -21,24 +25,10 @@ def round_to_nearest_even_minute(ts: datetime.datetime) -> datetime.datetime:
     Returns:
         Datetime rounded to nearest even minute with seconds/microseconds zeroed
     """
-    # First, zero out seconds and microseconds
-    base = ts.replace(second=0, microsecond=0)
-    
-    # Calculate distance to previous and next even minute
-    current_minute = base.minute
-    
-    if current_minute % 2 == 0:
-        # Already on even minute, check if seconds push us to next
-        if ts.second >= 30:
-            # Round up to next even minute
-            return base + datetime.timedelta(minutes=2)
-        else:
-            return base
-    else:
-        # Odd minute: decide whether to round down or up
-        if ts.second >= 30:
-            # Round up to next even minute
-            return base + datetime.timedelta(minutes=1)
-        else:
-            # Round down to previous even minute
-            return base - datetime.timedelta(minutes=1)
+    # Offset from the zeroed minute as plain integers: step back to the even
+    # minute, then forward one slot when the seconds reach 30. One replace and
+    # one addition instead of branch-dependent datetime arithmetic.
+    offset = _ROUND_UP_SECONDS if ts.second >= 30 else 0
+    if ts.minute & 1:
+        offset -= 60
+    return ts.replace(second=0, microsecond=0) + _OFFSETS[offset]
@@ -8,7 +8,7 @@ from typing import Optional, Tuple
 from pathlib import Path
 
 from EWMRS.ingest.wpc.config import WPC_CODED_SFC_BASE_URL, VALID_HOURS
-from EWMRS.util.file import WPC_SFC_DIR
+from EWMRS.util import file as fs
 from EWMRS.util.io import IOManager
 
 io_manager = IOManager("[WPC]")
@@ -153,10 +153,10 @@ def get_output_filepath(dt: Optional[datetime] = None) -> Path:
     dt_valid, valid_hour = get_latest_valid_hour(dt)
         
     # Ensure WPC_SFC_DIR exists (it is initialized in file.py but we should double check/create)
-    WPC_SFC_DIR.mkdir(parents=True, exist_ok=True)
+    fs.paths.WPC_SFC_DIR.mkdir(parents=True, exist_ok=True)
     
     filename = f"wpc_sfc_{dt_valid.strftime('%Y%m%d')}-{valid_hour:02d}0000.geojson"
-    return WPC_SFC_DIR / filename
+    return fs.paths.WPC_SFC_DIR / filename
 
 
 def get_latest_output_filepath() -> Path:
@@ -166,5 +166,5 @@ def get_latest_output_filepath() -> Path:
         Path to the latest.geojson file
     """
     # Ensure directory exists
-    WPC_SFC_DIR.mkdir(parents=True, exist_ok=True)
-    return WPC_SFC_DIR / "latest.geojson"
+    fs.paths.WPC_SFC_DIR.mkdir(parents=True, exist_ok=True)
+    return fs.paths.WPC_SFC_DIR / "latest.geojson"
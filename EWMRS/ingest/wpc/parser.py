@@ -10,11 +10,21 @@ for North American data.
 Data can span multiple lines - continuation lines don't start with a keyword.
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import Iterator, List, Dict, Tuple, Optional
 import re
+import sys
 
-# Keywords that start a new entry
-KEYWORDS = {"VALID", "HIGHS", "LOWS", "COLD", "WARM", "STNRY", "OCFNT", "TROF"}
+# Keywords that start a new entry (interned so membership tests compare by identity)
+KEYWORDS = frozenset(map(sys.intern, ("VALID", "HIGHS", "LOWS", "COLD", "WARM", "STNRY", "OCFNT", "TROF")))
+
+# Front/trough keywords mapped to their bucket under result["fronts"]
+_FRONT_KEYS = {
+    "COLD": "cold",
+    "WARM": "warm",
+    "STNRY": "stationary",
+    "OCFNT": "occluded",
+    "TROF": "trough",
+}
 
 
 def decode_coordinate(code: str) -> Tuple[float, float]:
@@ -44,33 +54,34 @@ def decode_coordinate(code: str) -> Tuple[float, float]:
     return (lat, lon)
 
 
-def _merge_continuation_lines(lines: List[str]) -> List[str]:
-    """Merge continuation lines with their parent keyword lines.
+def _iter_merged_lines(content: str) -> Iterator[str]:
+    """Yield lines of content with continuation lines merged into their parent keyword line.
     
-    Continuation lines don't start with a known keyword and should be
-    appended to the previous line.
+    Continuation lines don't start with a known keyword and are appended
+    to the previous line. Lines are produced one at a time so the full
+    list of merged lines is never held in memory.
     
     Args:
-        lines: Raw lines from the file
+        content: Full text content of the coded surface file
         
-    Returns:
-        List of merged lines where each line starts with a keyword
+    Yields:
+        Merged lines, each starting with a keyword
     """
-    merged = []
     current_line = ""
     
-    for line in lines:
+    for line in content.splitlines():
         line = line.strip()
         if not line:
             continue
         
         # Check if this line starts with a keyword
-        first_word = line.split()[0] if line.split() else ""
+        parts = line.split(maxsplit=1)
+        first_word = sys.intern(parts[0]) if parts else ""
         
         if first_word in KEYWORDS:
-            # Save previous line if exists
+            # Emit previous line if exists
             if current_line:
-                merged.append(current_line)
+                yield current_line
             current_line = line
         elif current_line:
             # Continuation line - append to current
@@ -79,9 +90,7 @@ def _merge_continuation_lines(lines: List[str]) -> List[str]:
     
     # Don't forget the last line
     if current_line:
-        merged.append(current_line)
-    
-    return merged
+        yield current_line
 
 
 def parse_pressure_centers(tokens: List[str], center_type: str) -> List[Dict]:
@@ -182,11 +191,8 @@ def parse_coded_surface(content: str) -> Dict:
         }
     }
     
-    # Split and merge continuation lines
-    raw_lines = content.strip().split('\n')
-    merged_lines = _merge_continuation_lines(raw_lines)
-    
-    for line in merged_lines:
+    # Walk the content line by line, merging continuation lines as we go
+    for line in _iter_merged_lines(content):
         parts = line.split()
         if not parts:
             continue
@@ -211,34 +217,11 @@ def parse_coded_surface(content: str) -> Dict:
             continue
         
         # Parse fronts and troughs
-        if keyword == "COLD":
-            coords = parse_front_coords(tokens)
-            if len(coords) >= 2:
-                result["fronts"]["cold"].append(coords)
-            continue
-            
-        if keyword == "WARM":
-            coords = parse_front_coords(tokens)
-            if len(coords) >= 2:
-                result["fronts"]["warm"].append(coords)
-            continue
-            
-        if keyword == "STNRY":
-            coords = parse_front_coords(tokens)
-            if len(coords) >= 2:
-                result["fronts"]["stationary"].append(coords)
-            continue
-            
-        if keyword == "OCFNT":
-            coords = parse_front_coords(tokens)
-            if len(coords) >= 2:
-                result["fronts"]["occluded"].append(coords)
-            continue
-            
-        if keyword == "TROF":
+        bucket = _FRONT_KEYS.get(keyword)
+        if bucket:
             coords = parse_front_coords(tokens)
             if len(coords) >= 2:
-                result["fronts"]["trough"].append(coords)
+                result["fronts"][bucket].append(coords)
             continue
     
     return result
@@ -1,73 +1,35 @@
 from ..util import file as fs
 
+# (name, colormap_key, filepath field of fs.paths, outdir field of fs.paths)
+_LAYERS = (
+    ("MRMS_MergedReflectivityQC", "NWS_Reflectivity", "MRMS_COMPOSITE_DIR", "GUI_COMPOSITE_DIR"),
+    ("MRMS_EchoTop18", "EnhancedEchoTop", "MRMS_ECHOTOP18_DIR", "GUI_ECHOTOP18_DIR"),
+    ("MRMS_EchoTop30", "EnhancedEchoTop", "MRMS_ECHOTOP30_DIR", "GUI_ECHOTOP30_DIR"),
+    ("MRMS_ReflectivityAtLowestAltitude", "NWS_Reflectivity", "MRMS_RALA_DIR", "GUI_RALA_DIR"),
+    ("MRMS_PrecipRate", "PrecipRate", "MRMS_PRECIPRATE_DIR", "GUI_PRECIPRATE_DIR"),
+    ("MRMS_VILDensity", "VILDensity", "MRMS_VIL_DIR", "GUI_VIL_DIR"),
+    ("MRMS_QPE", "QPE_01H", "MRMS_QPE_DIR", "GUI_QPE_DIR"),
+    ("MRMS_VII", "VILDensity", "MRMS_VII_DIR", "GUI_VII_DIR"),
+    ("MRMS_MergedAzShear_0-2kmAGL", "AzShear", "MRMS_AZSHEARLOW_DIR", "GUI_AZSHEARLOW_DIR"),
+    ("MRMS_MergedAzShear_3-6kmAGL", "AzShear", "MRMS_AZSHEARMID_DIR", "GUI_AZSHEARMID_DIR"),
+)
+
 def get_file_list():
     """
     Get the render file configuration list.
-    
+
     Returns list at call time to respect dynamic BASE_DIR changes.
     """
+    paths = fs.paths
     return [
         {
-            "name": "MRMS_MergedReflectivityQC",
-            "colormap_key": "NWS_Reflectivity",
-            "filepath": fs.MRMS_COMPOSITE_DIR,
-            "outdir": fs.GUI_COMPOSITE_DIR
-        },
-        {
-            "name": "MRMS_EchoTop18",
-            "colormap_key": "EnhancedEchoTop",
-            "filepath": fs.MRMS_ECHOTOP18_DIR,
-            "outdir": fs.GUI_ECHOTOP18_DIR
-        },
-        {
-            "name": "MRMS_EchoTop30",
-            "colormap_key": "EnhancedEchoTop",
-            "filepath": fs.MRMS_ECHOTOP30_DIR,
-            "outdir": fs.GUI_ECHOTOP30_DIR
-        },
-        {
-            "name": "MRMS_ReflectivityAtLowestAltitude",
-            "colormap_key": "NWS_Reflectivity",
-            "filepath": fs.MRMS_RALA_DIR,
-            "outdir": fs.GUI_RALA_DIR
-        },
-        {
-            "name": "MRMS_PrecipRate",
-            "colormap_key": "PrecipRate",
-            "filepath": fs.MRMS_PRECIPRATE_DIR,
-            "outdir": fs.GUI_PRECIPRATE_DIR
-        },
-        {
-            "name": "MRMS_VILDensity",
-            "colormap_key": "VILDensity",
-            "filepath": fs.MRMS_VIL_DIR,
-            "outdir": fs.GUI_VIL_DIR
-        },
-        {
-            "name": "MRMS_QPE",
-            "colormap_key": "QPE_01H",
-            "filepath": fs.MRMS_QPE_DIR,
-            "outdir": fs.GUI_QPE_DIR
-        },
-        {
-            "name": "MRMS_VII",
-            "colormap_key": "VILDensity",
-            "filepath": fs.MRMS_VII_DIR,
-            "outdir": fs.GUI_VII_DIR
-        },
-        {
-            "name": "MRMS_MergedAzShear_0-2kmAGL",
-            "colormap_key": "AzShear",
-            "filepath": fs.MRMS_AZSHEARLOW_DIR,
-            "outdir": fs.GUI_AZSHEARLOW_DIR
-        },
-        {
-            "name": "MRMS_MergedAzShear_3-6kmAGL",
-            "colormap_key": "AzShear",
-            "filepath": fs.MRMS_AZSHEARMID_DIR,
-            "outdir": fs.GUI_AZSHEARMID_DIR
+            "name": name,
+            "colormap_key": colormap_key,
+            "filepath": getattr(paths, filepath),
+            "outdir": getattr(paths, outdir)
         }
+        for name, colormap_key, filepath, outdir in _LAYERS
     ]
 
 # For backward compatibility - returns list at import time (use get_file_list() for dynamic paths)
-file_list = get_file_list()
\ No newline at end of file
+file_list = get_file_list()
@@ -1,19 +1,247 @@
 from pathlib import Path
-import json
+import os
+import struct
+import tempfile
+import zlib
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 import numpy as np
-from PIL import Image
+
+# Optional SIMD PNG encoder (several times faster than zlib for large grids)
+# Install with `pip install fpng_py`; Linux has no prebuilt wheels, so it builds from
+# source (or use `pip install git+https://github.com/K0lb3/fpng_py.git`)
+try:
+    import fpng_py
+    _HAVE_FPNG = True
+except ImportError:
+    _HAVE_FPNG = False
+
+# Optional Numba kernel for the interpolated colormap gather (multi-threaded over pixels)
+# Install with `pip install numba`; the NumPy path below is used when it is missing
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 from .tools import TransformUtils
 from ..util import file as fs
 from xarray import Dataset
 from ..util.io import IOManager
 from datetime import datetime
-import threading
 
 io_manager = IOManager("[Transform]")
 
-# Colormap cache to avoid re-reading JSON on every render
-_COLORMAP_CACHE = {}
-_COLORMAP_CACHE_LOCK = threading.Lock()
+# Number of entries in the lookup table built for interpolated colormaps
+_LUT_SIZE = 1024
+
+# Output directories already created by this process (skips a mkdir syscall per render)
+_KNOWN_DIRS = set()
+
+# PNG encoding: rows are split into horizontal strips that are deflated in parallel
+# (zlib releases the GIL) and stitched into a single zlib stream, like pigz does
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_COMPRESS_LEVEL = 1  # Fast compression (1=fastest, 9=smallest)
+_PNG_STRIPS = 8
+# Default LZ77 + Huffman: on radar frames (mostly transparent, smooth colour fields) it
+# was as fast as Z_RLE and ~2x faster than Z_HUFFMAN_ONLY, with much smaller files
+_PNG_STRATEGY = zlib.Z_DEFAULT_STRATEGY
+
+
+def _png_chunk(tag, data):
+    """Builds a complete PNG chunk (length, tag, data, CRC)."""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(data, zlib.crc32(tag)))
+
+
+def _deflate_strip(raw, last):
+    """Raw-deflates one strip; non-final strips end on a byte-aligned sync flush."""
+    compressor = zlib.compressobj(_PNG_COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS, 8, _PNG_STRATEGY)
+    return compressor.compress(raw) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+def _write_png_rgba(png_file, rgba):
+    """
+    Writes an (H, W, 4) uint8 array to an RGBA PNG file.
+
+    Every scanline uses filter type 0 (None). The strips are compressed as independent
+    raw deflate streams on a thread pool and concatenated into one IDAT chunk.
+    PNG has no empty images, so a zero height or width raises ValueError.
+    """
+    height, width = rgba.shape[:2]
+    if height == 0 or width == 0:
+        raise ValueError(f"Cannot write a {height}x{width} PNG: both dimensions must be at least 1")
+
+    # Prepend the filter-type byte to every scanline
+    raw = np.empty((height, 1 + width * 4), dtype=np.uint8)
+    raw[:, 0] = 0
+    raw[:, 1:] = rgba.reshape(height, width * 4)
+
+    bounds = np.linspace(0, height, min(_PNG_STRIPS, height) + 1, dtype=np.int64)
+    strips = [memoryview(raw[start:stop]) for start, stop in zip(bounds[:-1], bounds[1:])]
+    last_flags = [i == len(strips) - 1 for i in range(len(strips))]
+
+    with ThreadPoolExecutor(max_workers=min(len(strips), os.cpu_count() or 1)) as executor:
+        parts = list(executor.map(_deflate_strip, strips, last_flags))
+
+    # zlib header (deflate, 32K window, fastest) + concatenated strips + Adler-32 trailer
+    parts.insert(0, b"\x78\x01")
+    parts.append(struct.pack(">I", zlib.adler32(raw)))
+
+    idat_length = sum(len(part) for part in parts)
+    idat_crc = zlib.crc32(b"IDAT")
+    for part in parts:
+        idat_crc = zlib.crc32(part, idat_crc)
+
+    with open(png_file, "wb") as f:
+        f.write(_PNG_SIGNATURE)
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+        f.write(struct.pack(">I", idat_length) + b"IDAT")
+        for part in parts:
+            f.write(part)
+        f.write(struct.pack(">I", idat_crc))
+        f.write(_png_chunk(b"IEND", b""))
+
+
+def _build_lut(thresholds, colors):
+    """
+    Samples an interpolated colormap into an (_LUT_SIZE + 1, 4) uint8 RGBA table.
+
+    Row 0 is transparent and holds values below the first threshold. Rows
+    1.._LUT_SIZE split [first, last threshold] into equal bins, each sampled
+    at its midpoint.
+    """
+    vmin, vmax = thresholds[0], thresholds[-1]
+    step = (vmax - vmin) / (_LUT_SIZE - 1)
+    samples = vmin + (np.arange(_LUT_SIZE) + 0.5) * step
+
+    lut = np.zeros((_LUT_SIZE + 1, 4), dtype=np.uint8)
+    for channel in range(3):
+        values = np.interp(samples, thresholds, colors[:, channel])
+        # Saturate to [0, 255] with branch-free fmax/fmin before the uint8 store
+        np.fmin(np.fmax(values, 0, out=values), 255, out=values)
+        lut[1:, channel] = values
+    lut[1:, 3] = 255
+    return lut
+
+
+def _lut_indices(flat_data, vmin, scale):
+    """Maps values to rows of an interpolated colormap's LUT (truncated bin + 1, clamped)."""
+    if scale == 0:
+        # Flat range (first threshold == last): nothing to interpolate, so values at or
+        # above it take the top row and anything below (or NaN) stays transparent
+        return np.where(flat_data >= vmin, _LUT_SIZE, 0)
+
+    lut_index = (flat_data - vmin) * scale + 1
+    # Branch-free clamp to the table (fmax also maps NaN to the transparent row)
+    np.fmin(np.fmax(lut_index, 0, out=lut_index), _LUT_SIZE, out=lut_index)
+    return lut_index.astype(np.intp)
+
+
+if _HAVE_NUMBA:
+    @njit(parallel=True, boundscheck=False, cache=True)
+    def _apply_lut_numba(flat_data, lut, vmin, scale, out):
+        """Same mapping as the NumPy path: truncated bin + 1, clamped, NaN -> transparent row 0."""
+        top = np.float32(lut.shape[0] - 1)
+        flat_range = scale == 0
+        for i in prange(flat_data.shape[0]):
+            if flat_range:
+                # As in _lut_indices: top row at or above vmin, transparent below or NaN
+                idx = int(top) if flat_data[i] >= vmin else 0
+            else:
+                k = (flat_data[i] - vmin) * scale + np.float32(1)
+                # not (k > 0) is also true for NaN; fastmath is off so this comparison holds.
+                # Clamp before int(): +inf or values beyond int64 would otherwise wrap negative
+                idx = 0 if not (k > 0) else int(min(k, top))
+            out[i, 0] = lut[idx, 0]
+            out[i, 1] = lut[idx, 1]
+            out[i, 2] = lut[idx, 2]
+            out[i, 3] = lut[idx, 3]
+
+
+def _parse_colormap(cmap):
+    """Converts a colormaps.json entry into (thresholds, colors, interpolate, lut)."""
+    # float32 to match the grid, so searchsorted/index math never upcasts the data
+    thresholds = np.array([t["value"] for t in cmap["thresholds"]], dtype=np.float32)
+    colors = np.array([t["rgb"] for t in cmap["thresholds"]], dtype=np.float32)
+    interpolate = cmap.get("interpolate", True)
+
+    # Both np.interp and np.searchsorted assume ascending thresholds
+    if np.any(np.diff(thresholds) < 0):
+        raise ValueError(f"Colormap '{cmap.get('name')}' thresholds must be in ascending order")
+
+    if interpolate:
+        lut = _build_lut(thresholds, colors)
+    else:
+        # Discrete colormaps: transparent row 0, then one opaque RGBA row per threshold
+        lut = np.zeros((len(colors) + 1, 4), dtype=np.uint8)
+        lut[1:, :3] = colors
+        lut[1:, 3] = 255
+    return (thresholds, colors, interpolate, lut)
+
+
+def reload_colormaps():
+    """
+    Parses colormaps.json and replaces the colormap table with the result.
+
+    The table is built at import, so forked render workers inherit it; call this only
+    to pick up edits to the JSON at runtime. Invalid colormaps are logged and skipped.
+    """
+    global _COLORMAPS
+
+    with open(fs.GUI_COLORMAP_JSON, 'rb') as f:
+        cmaps_json = fs.json_loads(f.read())
+
+    colormaps = {}
+    for source in cmaps_json:
+        for cmap in source.get("colormaps", []):
+            # A malformed entry (missing key, wrong type, bad thresholds) only drops that
+            # colormap, so the layers using it fail at render time instead of the import
+            try:
+                colormaps.setdefault(cmap.get("name"), _parse_colormap(cmap))
+            except (KeyError, TypeError, ValueError) as e:
+                io_manager.write_error(f"Skipping invalid colormap: {e!r}")
+
+    # Read-only and swapped in with a single rebind, so readers need no lock
+    _COLORMAPS = MappingProxyType(colormaps)
+
+
+# Every colormap, parsed once at import: name -> (thresholds, colors, interpolate, lut)
+_COLORMAPS = MappingProxyType({})
+try:
+    reload_colormaps()
+except (OSError, ValueError, TypeError, AttributeError) as e:
+    # Also covers a JSON file whose top level isn't a list of sources; never fail the import
+    io_manager.write_warning(f"Failed to load colormaps from {fs.GUI_COLORMAP_JSON}: {e}")
+
+
+def read_index(index_file: Path):
+    """Returns the timestamp list stored in index_file."""
+    with open(index_file, 'rb') as f:
+        return fs.json_loads(f.read())
+
+
+def write_index(index_file: Path, timestamps):
+    """
+    Atomically replaces index_file with the JSON-encoded timestamps.
+
+    The list is written to a temp file in the same directory and renamed over the
+    index, so concurrent writers cannot interleave and readers never see partial JSON.
+    """
+    fd, tmp = tempfile.mkstemp(dir=index_file.parent, prefix=".index.", suffix=".json")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(fs.json_dumps(timestamps))
+        # mkstemp creates the file 0600; keep the index readable like a normal file
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, index_file)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 
 class GUILayerRenderer:
     def __init__(self, dataset: Dataset, outdir: Path, colormap_key, file_name, timestamp):
@@ -33,109 +261,115 @@ class GUILayerRenderer:
 
     def _get_cmap(self):
         """
-        Returns cached colormap data to avoid re-reading JSON file.
+        Returns the colormap parsed at import (see reload_colormaps).
         
         Returns:
             thresholds (np.ndarray): array of dBZ or value thresholds
             colors (np.ndarray): array of RGB colors corresponding to thresholds
             interpolate (bool): whether to interpolate between colors
+            lut (np.ndarray): uint8 RGBA table whose row 0 is transparent (below the first threshold)
         """
-        # Check cache first
-        if self.colormap_key in _COLORMAP_CACHE:
-            return _COLORMAP_CACHE[self.colormap_key]
-        
-        with _COLORMAP_CACHE_LOCK:
-            # Double-check after acquiring lock
-            if self.colormap_key in _COLORMAP_CACHE:
-                return _COLORMAP_CACHE[self.colormap_key]
-            
-            with open(fs.GUI_COLORMAP_JSON, 'r') as f:
-                cmaps_json = json.load(f)
-
-            # Iterate through all colormaps to find the matching key
-            for source in cmaps_json:
-                for cmap in source.get("colormaps", []):
-                    if cmap.get("name") == self.colormap_key:
-                        thresholds = np.array([t["value"] for t in cmap["thresholds"]])
-                        colors = np.array([t["rgb"] for t in cmap["thresholds"]], dtype=np.float32)
-                        interpolate = cmap.get("interpolate", True)
-                        result = (thresholds, colors, interpolate)
-                        _COLORMAP_CACHE[self.colormap_key] = result
-                        return result
-            
+        try:
+            return _COLORMAPS[self.colormap_key]
+        except KeyError:
             # If key not found, raise an error with the path we tried
-            raise ValueError(f"Colormap '{self.colormap_key}' not found in {fs.GUI_COLORMAP_JSON}")
+            raise ValueError(f"Colormap '{self.colormap_key}' not found in {fs.GUI_COLORMAP_JSON}") from None
 
     def convert_to_png(self):
         """
         Converts dataset to a png file and then saves it to outdir.
-        Reprojects data to EPSG:3857 (Web Mercator) projection.
+        The grid is rendered as-is (no EPSG:3857 reprojection); one pixel per grid cell.
         """
 
+        # Step 0: Resolve the output file; a PNG already rendered for this timestamp is reused
+        # Find timestamp
+        try:
+            dt = datetime.fromisoformat(self.timestamp)
+        except ValueError:
+            # Fallback if timestamp is a filename or path?
+            # Assuming callers pass a valid ISO timestamp or we use TransformUtils if it looks like a path
+            cleaned_ts = TransformUtils.find_timestamp(self.timestamp)
+            dt = datetime.fromisoformat(cleaned_ts)
+        
+        # Force seconds to 00 for consistency and fast lookup
+        timestamp = dt.strftime(r"%Y%m%d-%H%M00")
+
+        # Define the full file path
+        png_file = self.outdir / f"{self.file_name}_{timestamp}.png"
+
+        if png_file.exists():
+            io_manager.write_debug(f"Skipping {png_file}, already exists")
+            # Still index it in case an earlier run died between the rename and the index update
+            self._update_index(timestamp)
+            return png_file, timestamp
+
         # Step 1: No Reprojection needed for 1km/pixel raw render
         # We will resize the output image based on physical domain size later
-        data = self.ds['unknown'].values
+        # float32 (what MRMS stores) and C-contiguous in one step, usually without a copy;
+        # every intermediate below stays float32 and ravel() is a view
+        data = np.ascontiguousarray(self.ds['unknown'].values, dtype=np.float32)
 
         # Step 2: Get colormap
-        thresholds, colors, interpolate = self._get_cmap()
+        thresholds, colors, interpolate, lut = self._get_cmap()
 
         # Step 2.5: Apply colormap
-        # Use ravel() to avoid copy if possible, though digitize/interp might flatten anyway
+        # Flat view of the grid; it is only read, never written
         flat_data = data.ravel()
 
-        # Pre-allocate output array (N, 4) in uint8 to save memory
-        N = flat_data.shape[0]
-        rgba_flat = np.empty((N, 4), dtype=np.uint8)
+        # Pre-allocate the (H, W, 4) uint8 output; colors are gathered straight into it
+        # Note: Grib data is often (lat, lon), where lat is row (y), lon is col (x)
+        # We want image to be (height, width) which corresponds to (lat, lon) shape
+        rgba = np.empty((data.shape[0], data.shape[1], 4), dtype=np.uint8)
+        rgba_flat = rgba.reshape(-1, 4)
 
+        # Alpha comes from the table: row 0 is transparent for values < first threshold
+        # This ensures that values below the defined range (like AzShear 0 when min is 1) are transparent
         if interpolate:
-            # Interpolate directly into the output array channels
-            # Casting to uint8 immediately saves memory compared to keeping full float arrays
-            rgba_flat[:, 0] = np.interp(flat_data, thresholds, colors[:, 0]).astype(np.uint8)
-            rgba_flat[:, 1] = np.interp(flat_data, thresholds, colors[:, 1]).astype(np.uint8)
-            rgba_flat[:, 2] = np.interp(flat_data, thresholds, colors[:, 2]).astype(np.uint8)
+            # Quantize values to their LUT bin and gather RGBA in a single pass
+            # instead of running np.interp over every pixel once per channel
+            vmin, vmax = thresholds[0], thresholds[-1]
+            scale = (_LUT_SIZE - 1) / (vmax - vmin) if vmax > vmin else 0.0
+            if _HAVE_NUMBA:
+                # Fused index + gather across all cores, no temporary index array
+                _apply_lut_numba(flat_data, lut, vmin, np.float32(scale), rgba_flat)
+                indices = None
+            else:
+                indices = _lut_indices(flat_data, vmin, scale)
         else:
             # Discrete color mapping
-            indices = np.digitize(flat_data, thresholds) - 1
-            indices = np.clip(indices, 0, len(colors) - 1)
-            
-            # Cast colors table to uint8 once
-            colors_uint8 = colors.astype(np.uint8)
-
-            # Map directly into the output array
-            rgba_flat[:, :3] = colors_uint8[indices]
+            # searchsorted(side='right') matches digitize for ascending thresholds in one pass
+            indices = np.searchsorted(thresholds, flat_data, side='right')
 
-        # Alpha channel: transparent for values < first threshold
-        # This ensures that values below the defined range (like AzShear 0 when min is 1) are transparent
-        rgba_flat[:, 3] = np.where(flat_data < thresholds[0], 0, 255).astype(np.uint8)
-
-        # Reshape to original grid
-        # Note: Grib data is often (lat, lon), where lat is row (y), lon is col (x)
-        # We want image to be (height, width) which corresponds to (lat, lon) shape
-        rgba = rgba_flat.reshape((data.shape[0], data.shape[1], 4))
+        if indices is not None:
+            # Gather whole RGBA rows into the output; mode='clip' clamps indices to the table
+            np.take(lut, indices, axis=0, out=rgba_flat, mode='clip')
 
         # Step 3: Generate and save
-        # Find timestamp
-        try:
-            dt = datetime.fromisoformat(self.timestamp)
-        except ValueError:
-            # Fallback if timestamp is a filename or path?
-            # Assuming callers pass a valid ISO timestamp or we use TransformUtils if it looks like a path
-            cleaned_ts = TransformUtils.find_timestamp(self.timestamp)
-            dt = datetime.fromisoformat(cleaned_ts)
-        
-        # Force seconds to 00 for consistency and fast lookup
-        timestamp = dt.strftime(r"%Y%m%d-%H%M00")
-
         # Ensure the output directory exists
-        self.outdir.mkdir(parents=True, exist_ok=True)
-
-        # Define the full file path
-        png_file = self.outdir / f"{self.file_name}_{timestamp}.png"
+        if self.outdir not in _KNOWN_DIRS:
+            self.outdir.mkdir(parents=True, exist_ok=True)
+            _KNOWN_DIRS.add(self.outdir)
 
-        # Create the image and save
-        img = Image.fromarray(rgba, mode="RGBA")
-        
-        img.save(png_file, compress_level=1)  # Fast compression (1=fastest, 9=smallest)
+        # Encode to a temp file and rename it into place, so the existence check above
+        # never sees a half-written PNG
+        rgba = np.ascontiguousarray(rgba)
+        fd, tmp_file = tempfile.mkstemp(dir=self.outdir, prefix=f".{png_file.stem}.", suffix=".png.tmp")
+        try:
+            # Both encoders write by path; the descriptor is only used to reserve the name
+            os.close(fd)
+            if _HAVE_FPNG:
+                Path(tmp_file).write_bytes(fpng_py.fpng_encode_image_to_memory(rgba, rgba.shape[1], rgba.shape[0], 4))
+            else:
+                _write_png_rgba(tmp_file, rgba)
+            # mkstemp creates the file 0600; the GUI server has to be able to read it
+            os.chmod(tmp_file, 0o644)
+            os.replace(tmp_file, png_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
 
         io_manager.write_debug(f"Saved {self.file_name} PNG file to {png_file}")
 
@@ -147,24 +381,27 @@ class GUILayerRenderer:
     def _update_index(self, new_timestamp):
         """
         Updates the index.json file in the output directory with the new timestamp.
-        Maintains a sorted, unique list of timestamps.
+        Maintains a sorted (newest first), unique list of timestamps.
         """
         index_file = self.outdir / "index.json"
         timestamps = []
 
         if index_file.exists():
             try:
-                with open(index_file, 'r') as f:
-                    timestamps = json.load(f)
+                timestamps = read_index(index_file)
             except Exception as e:
                 io_manager.write_warning(f"Failed to read index.json in {self.outdir}: {e}. Creating new one.")
 
-        if new_timestamp not in timestamps:
-            timestamps.append(new_timestamp)
-            timestamps.sort(reverse=True) # Newest first
+        if new_timestamp in timestamps:
+            return
 
-            try:
-                with open(index_file, 'w') as f:
-                    json.dump(timestamps, f)
-            except Exception as e:
-                io_manager.write_error(f"Failed to update index.json in {self.outdir}: {e}")
\ No newline at end of file
+        # index.json is newest first (the API serves it as-is); "YYYYMMDD-HHMMSS" strings
+        # sort lexically, so insert into the ascending order instead of resorting
+        ascending = timestamps[::-1]
+        insort(ascending, new_timestamp)
+        timestamps = ascending[::-1] # Newest first
+
+        try:
+            write_index(index_file, timestamps)
+        except Exception as e:
+            io_manager.write_error(f"Failed to update index.json in {self.outdir}: {e}")
@@ -5,12 +5,17 @@ from ..util.io import IOManager
 from pathlib import Path
 import re
 import numpy as np
-from pyproj import Transformer
 
 io_manager = IOManager("[Transform]")
 
-# Cached transformer for EPSG:4326 to EPSG:3857 (thread-safe per pyproj docs)
-_TRANSFORMER_4326_TO_3857 = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+# Filename timestamp patterns tried in order by TransformUtils.find_timestamp
+_TS_PATTERNS = [re.compile(p) for p in (
+    r'MRMS_MergedReflectivityQC_(\d{8})-(\d{6})',
+    r'(\d{8})-(\d{6})_renamed',
+    r'(\d{8}-\d{6})',
+    r'.*(\d{8})-(\d{6}).*',
+    r's(\d{4})(\d{3})(\d{2})(\d{2})(\d{2})(\d)'
+)]
 
 class TransformUtils:
     @staticmethod
@@ -65,16 +70,8 @@ class TransformUtils:
         filename = Path(filepath).name
         io_manager.write_debug(f"Extracting timestamp from filename: {filename}")
         
-        patterns = [
-            r'MRMS_MergedReflectivityQC_(\d{8})-(\d{6})',
-            r'(\d{8})-(\d{6})_renamed',
-            r'(\d{8}-\d{6})',
-            r'.*(\d{8})-(\d{6}).*',
-            r's(\d{4})(\d{3})(\d{2})(\d{2})(\d{2})(\d)'
-        ]
-        
-        for pattern_idx, pattern in enumerate(patterns):
-            match = re.search(pattern, filename)
+        for pattern in _TS_PATTERNS:
+            match = pattern.search(filename)
             if match:
                 groups = match.groups()
                 
@@ -1,17 +1,188 @@
 
 import datetime
+import json
+import os
+import tempfile
 import time
+import threading
 import concurrent.futures
-from pathlib import Path
+from collections import OrderedDict
 from EWMRS.ingest.mrms.s3_sync import FileFinder
 from EWMRS.ingest.mrms.utils import extract_timestamp
 from EWMRS.ingest.mrms.parse import parse_mrms_bucket_path
 from EWMRS.ingest.mrms.config import bucket
 from EWMRS.ingest.mrms.timestamp_utils import round_to_nearest_even_minute
 from EWMRS.util.io import IOManager
+from EWMRS.util import file as fs
 
 io_manager = IOManager("[DataIngestion]")
 
+# Short-lived cache of S3 listings so has_update and latest_common_minute_1h
+# share one lookup per bucket path within a scheduler tick
+_LOOKUP_TTL = 30  # seconds
+_LOOKUP_CACHE_SIZE = 64
+_LOOKUP_DEPTH = 20  # Entries listed per modifier; shared so both callers hit the same cache entry
+# Scheduler timestamps are rounded to even minutes (see round_to_nearest_even_minute)
+_SLOT_SECONDS = 120
+
+# Upper bound on concurrent S3 listings, to stay clear of S3 SlowDown throttling
+_MAX_LOOKUP_WORKERS = 16
+_LOOKUP_CACHE = OrderedDict()
+_LOOKUP_LOCK = threading.Lock()
+# outdir -> (directory mtime_ns, (has_local_files, latest_local_time)), shared by all checkers
+_LOCAL_SCAN_CACHE = {}
+
+# Both caches are mirrored to BASE_DIR/.cache so a restarted scheduler can skip the
+# S3 listings of the current TTL window and the scans of unchanged directories
+_DISK_CACHE_NAME = "scheduler_cache.json"
+_DISK_CACHE_LOADED = False
+_DISK_CACHE_DIRTY = False
+_DISK_CACHE_WRITE_LOCK = threading.Lock()
+
+
+def _disk_cache_file():
+    return fs.BASE_DIR / ".cache" / _DISK_CACHE_NAME
+
+
+def _parse_time(value):
+    return datetime.datetime.fromisoformat(value) if value is not None else None
+
+
+def _load_disk_cache():
+    """Seed the in-memory caches from the file left by a previous process (first call only)."""
+    global _DISK_CACHE_LOADED
+    if _DISK_CACHE_LOADED:
+        return
+    with _LOOKUP_LOCK:
+        if _DISK_CACHE_LOADED:
+            return
+        _DISK_CACHE_LOADED = True
+        try:
+            with open(_disk_cache_file(), "rb") as f:
+                data = json.loads(f.read())
+            window = int(time.time() // _LOOKUP_TTL)
+            for bucket_path, reference_minute, entry_window, max_entries, files in data.get("lookups", ()):
+                # Listings from an earlier TTL window are stale, exactly as in memory
+                if entry_window != window:
+                    continue
+                key = (bucket_path, _parse_time(reference_minute), entry_window)
+                _LOOKUP_CACHE[key] = (max_entries, tuple((path, _parse_time(ts)) for path, ts in files))
+            for outdir, mtime, has_local_files, latest_local_time in data.get("local", ()):
+                _LOCAL_SCAN_CACHE.setdefault(outdir, (mtime, (has_local_files, _parse_time(latest_local_time))))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # A corrupt or foreign cache file only costs the warm start
+            io_manager.write_debug(f"Ignoring scheduler cache: {e}")
+
+
+def _mark_disk_cache_dirty():
+    """Flag that the caches changed. Must be called with _LOOKUP_LOCK held."""
+    global _DISK_CACHE_DIRTY
+    _DISK_CACHE_DIRTY = True
+
+
+def _flush_disk_cache():
+    """
+    Write both caches to disk atomically if they changed since the last flush.
+
+    Called once per checker pass rather than on every store. Only the snapshot is
+    taken under _LOOKUP_LOCK, so lookups never wait on the file write.
+    """
+    global _DISK_CACHE_DIRTY
+    # Serializes flushers so an older snapshot can never replace a newer file
+    with _DISK_CACHE_WRITE_LOCK:
+        with _LOOKUP_LOCK:
+            if not _DISK_CACHE_DIRTY:
+                return
+            _DISK_CACHE_DIRTY = False
+            lookups = list(_LOOKUP_CACHE.items())
+            local = list(_LOCAL_SCAN_CACHE.items())
+
+        data = {
+            "lookups": [
+                (bucket_path, reference_minute.isoformat(), window, max_entries,
+                 [(path, ts.isoformat()) for path, ts in files])
+                for (bucket_path, reference_minute, window), (max_entries, files) in lookups
+            ],
+            "local": [
+                (outdir, mtime, has_local_files, latest_local_time.isoformat() if latest_local_time else None)
+                for outdir, (mtime, (has_local_files, latest_local_time)) in local
+            ],
+        }
+        cache_file = _disk_cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_file.parent, prefix=".scheduler.", suffix=".json")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp, cache_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            io_manager.write_debug(f"Could not write scheduler cache: {e}")
+
+
+def _cached_lookup(finder, bucket_path):
+    """
+    Return finder.lookup_files(bucket_path) as a tuple, reusing a listing fetched in the
+    same TTL window for the same reference minute.
+
+    A cached listing is only reused if it holds at least finder.max_entries entries.
+    """
+    _load_disk_cache()
+
+    # lookup_files drops files newer than finder.dt, so the reference minute is part of the key
+    reference_minute = finder.dt.replace(second=0, microsecond=0)
+    key = (bucket_path, reference_minute, int(time.time() // _LOOKUP_TTL))
+    with _LOOKUP_LOCK:
+        cached = _LOOKUP_CACHE.get(key)
+    if cached is not None and cached[0] >= finder.max_entries:
+        return cached[1][:finder.max_entries]
+
+    # Stored as a tuple so a shared listing cannot be mutated by a caller
+    files_with_timestamps = tuple(finder.lookup_files(bucket_path, verbose=False))
+    if files_with_timestamps:
+        with _LOOKUP_LOCK:
+            _LOOKUP_CACHE[key] = (finder.max_entries, files_with_timestamps)
+            _LOOKUP_CACHE.move_to_end(key)
+            while len(_LOOKUP_CACHE) > _LOOKUP_CACHE_SIZE:
+                _LOOKUP_CACHE.popitem(last=False)
+            _mark_disk_cache_dirty()
+    return files_with_timestamps
+
+
+def _latest_common(modifier_times):
+    """
+    Return the newest timestamp present in every set of modifier_times, or None.
+
+    Timestamps are rounded to even minutes, i.e. whole 2-minute slots since the epoch.
+    Each set becomes an int bitmap whose bit i means "i slots before the newest
+    timestamp seen", so the intersection is one & per modifier and the latest common
+    minute is the lowest set bit.
+    """
+    newest = max(max(times) for times in modifier_times)
+    top_slot = int(newest.timestamp()) // _SLOT_SECONDS
+
+    common = -1  # All bits set
+    # Smallest sets first: they empty the running intersection soonest, and once it is
+    # empty (e.g. one modifier lagging) the remaining bitmaps are never built
+    for times in sorted(modifier_times, key=len):
+        bitmap = 0
+        for ts in times:
+            bitmap |= 1 << (top_slot - int(ts.timestamp()) // _SLOT_SECONDS)
+        common &= bitmap
+        if not common:
+            return None
+
+    offset = (common & -common).bit_length() - 1  # Index of the lowest set bit
+    return newest - datetime.timedelta(seconds=offset * _SLOT_SECONDS)
+
 
 class MRMSUpdateChecker:
     """Checks MRMS sources for new files and finds the latest common timestamps."""
@@ -26,35 +197,29 @@ class MRMSUpdateChecker:
         if reference_dt is None:
             reference_dt = datetime.datetime.now(datetime.timezone.utc)
 
-        finder = FileFinder(reference_dt, bucket, self.max_entries, io_manager)
+        finder = FileFinder(reference_dt, bucket, max(self.max_entries, _LOOKUP_DEPTH), io_manager)
         try:
             bucket_path = parse_mrms_bucket_path(reference_dt, region, modifier)
-            files_with_timestamps = finder.lookup_files(bucket_path, verbose=False)
+            files_with_timestamps = _cached_lookup(finder, bucket_path)
             if not files_with_timestamps:
                 if self.verbose:
                     print(f"[{modifier}] No remote files found")
                 return False
 
-            _, latest_source_time = max(files_with_timestamps, key=lambda x: x[1])
-            local_files = list(Path(outdir).glob("*.gz")) + list(Path(outdir).glob("*.grib2"))
+            # lookup_files returns the listing newest first, so no max() pass is needed
+            latest_source_time = files_with_timestamps[0][1]
+            has_local_files, latest_local_time = self._scan_local(outdir)
 
-            if not local_files:
+            if not has_local_files:
                 if self.verbose:
                     print(f"[{modifier}] No local files found")
                 return True
 
-            local_times = []
-            for f in local_files:
-                ts = extract_timestamp(f.name)
-                if ts:
-                    local_times.append(ts)
-
-            if not local_times:
+            if latest_local_time is None:
                 if self.verbose:
                     print(f"[{modifier}] Could not extract timestamps from local files")
                 return True
 
-            latest_local_time = max(local_times)
             if self.verbose:
                 print(f"[{modifier}] Remote: {latest_source_time}, Local: {latest_local_time}")
             return latest_source_time > latest_local_time
@@ -63,41 +228,85 @@ class MRMSUpdateChecker:
             print(f"[MRMSUpdateChecker] Error checking {modifier}: {e}")
             return False
 
+    def _scan_local(self, outdir):
+        """
+        Returns (has_local_files, latest_local_time) for the MRMS files in outdir.
+
+        The result is cached per directory and reused until the directory's mtime
+        changes, which happens whenever a file is added, removed or renamed.
+        """
+        _load_disk_cache()
+
+        try:
+            mtime = os.stat(outdir).st_mtime_ns
+        except FileNotFoundError:
+            return False, None
+
+        # Keyed by the path string so entries loaded from disk match Path arguments
+        key = os.fspath(outdir)
+        cached = _LOCAL_SCAN_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # Single directory pass; only entry names are needed for the timestamps
+        has_local_files = False
+        latest_local_time = None
+        with os.scandir(outdir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith((".gz", ".grib2")) and entry.is_file():
+                    has_local_files = True
+                    ts = extract_timestamp(name)
+                    if ts and (latest_local_time is None or ts > latest_local_time):
+                        latest_local_time = ts
+
+        # mtime was read before the scan, so a file added mid-scan forces a rescan next time
+        result = (has_local_files, latest_local_time)
+        with _LOOKUP_LOCK:
+            _LOCAL_SCAN_CACHE[key] = (mtime, result)
+            _mark_disk_cache_dirty()
+        return result
+
     def _get_modifier_times(self, modifier_tuple, reference_dt):
-        """Helper to fetch timestamps for a single modifier."""
+        """Helper to fetch the (rounded, UTC) timestamps for a single modifier as a frozenset."""
         region, modifier, _ = modifier_tuple
-        finder = FileFinder(reference_dt, bucket, 20, io_manager)
+        finder = FileFinder(reference_dt, bucket, _LOOKUP_DEPTH, io_manager)
         bucket_path = parse_mrms_bucket_path(reference_dt, region, modifier)
         try:
-            files_with_timestamps = finder.lookup_files(bucket_path, verbose=False)
+            files_with_timestamps = _cached_lookup(finder, bucket_path)
         except Exception as e:
             if self.verbose:
                  print(f"[{modifier}] Error looking up files: {e}")
-            return set()
+            return frozenset()
 
         if not files_with_timestamps:
             if self.verbose:
                 print(f"[{modifier}] No remote files found")
-            return set()
+            return frozenset()
 
-        processed_timestamps = []
-        for s3_path, ts in files_with_timestamps:
+        def _normalized(ts):
             if ts.tzinfo is None:
                 ts = ts.replace(tzinfo=datetime.timezone.utc)
             elif ts.tzinfo != datetime.timezone.utc:
                 ts = ts.astimezone(datetime.timezone.utc)
-            
-            ts_rounded = round_to_nearest_even_minute(ts)
-            processed_timestamps.append(ts_rounded)
-            
-        return set(processed_timestamps)
+            return round_to_nearest_even_minute(ts)
+
+        # Built straight from a generator (no intermediate list); frozen because it is
+        # only ever read by _latest_common
+        return frozenset(_normalized(ts) for _, ts in files_with_timestamps)
 
 
     def all_sources_available(self, modifiers):
         """Check all MRMS modifiers for new data availability."""
         all_new = True
-        for modifier_tuple in modifiers:
-            if self.has_update(modifier_tuple):
+        # Each check is a network lookup, so run them concurrently (reported in input order)
+        workers = max(1, min(_MAX_LOOKUP_WORKERS, len(modifiers)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.has_update, modifiers))
+        _flush_disk_cache()
+
+        for modifier_tuple, updated in zip(modifiers, results):
+            if updated:
                 print(f"[{modifier_tuple[1]}] New file available")
             else:
                 print(f"[{modifier_tuple[1]}] No new file")
@@ -117,27 +326,28 @@ class MRMSUpdateChecker:
         modifier_times = []
 
         # Parallelize checks using ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        workers = max(1, min(_MAX_LOOKUP_WORKERS, len(modifiers)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
             # Map returns an iterator in the order of the inputs
             results = executor.map(lambda m: self._get_modifier_times(m, reference_dt), modifiers)
             
             for res in results:
                 if res:
                     modifier_times.append(res)
+        _flush_disk_cache()
 
         if not modifier_times:
             if self.verbose:
                 print("[Scheduler] No files found in any modifier")
             return self.check_https_fallback(modifiers, reference_dt)
 
-        common_minutes = set.intersection(*modifier_times)
-        if not common_minutes:
+        latest_common = _latest_common(modifier_times)
+        if latest_common is None:
             if self.verbose:
                 print("[Scheduler] No common timestamps across all modifiers")
 
             return self.check_https_fallback(modifiers, reference_dt)
 
-        latest_common = max(common_minutes)
         if self.verbose:
             print(f"[Scheduler] Latest common timestamp: {latest_common}")
         return latest_common
@@ -184,12 +394,11 @@ class MRMSUpdateChecker:
         if not modifier_times:
             return None
 
-        common_minutes = set.intersection(*modifier_times)
-        if not common_minutes:
+        latest_common = _latest_common(modifier_times)
+        if latest_common is None:
             if self.verbose:
                 print("[Scheduler] HTTPS: No common timestamps across all modifiers")
             return None
 
-        latest_common = max(common_minutes)
         print(f"[Scheduler] HTTPS Fallback found latest common: {latest_common}")
         return latest_common
\ No newline at end of file
@@ -1,7 +1,10 @@
 from pathlib import Path
 import sys
 import os
+import json
 import platform
+from dataclasses import dataclass
+from functools import cache
 from datetime import datetime
 
 from ..util.io import IOManager
@@ -20,6 +23,107 @@ if _arg_base_dir:
 else:
     BASE_DIR = _DEFAULT_BASE_DIR
 
+@dataclass(frozen=True)
+class Paths:
+    """Every data and GUI path, derived from a single base directory."""
+    BASE_DIR: Path
+    DATA_DIR: Path
+    MRMS_RALA_DIR: Path
+    MRMS_CGFLASH_DIR: Path
+    MRMS_NLDN_DIR: Path
+    MRMS_ECHOTOP18_DIR: Path
+    MRMS_ECHOTOP30_DIR: Path
+    MRMS_QPE_DIR: Path
+    MRMS_RAIN_DIR: Path
+    MRMS_PRECIPRATE_DIR: Path
+    MRMS_PROBSEVERE_DIR: Path
+    MRMS_FLASH_DIR: Path
+    MRMS_VIL_DIR: Path
+    MRMS_VII_DIR: Path
+    MRMS_ROTATIONT_DIR: Path
+    MRMS_COMPOSITE_DIR: Path
+    MRMS_RHOHV_DIR: Path
+    MRMS_PRECIPTYP_DIR: Path
+    MRMS_MESH_DIR: Path
+    MRMS_AZSHEARLOW_DIR: Path
+    MRMS_AZSHEARMID_DIR: Path
+    GOES_GLM_DIR: Path
+    STORMCELL_JSON: Path
+    WPC_SFC_DIR: Path
+    GUI_DIR: Path
+    GUI_RALA_DIR: Path
+    GUI_NLDN_DIR: Path
+    GUI_ECHOTOP18_DIR: Path
+    GUI_ECHOTOP30_DIR: Path
+    GUI_QPE_DIR: Path
+    GUI_AZSHEARLOW_DIR: Path
+    GUI_AZSHEARMID_DIR: Path
+    GUI_PRECIPRATE_DIR: Path
+    GUI_PROBSEVERE_DIR: Path
+    GUI_FLASH_DIR: Path
+    GUI_VIL_DIR: Path
+    GUI_VII_DIR: Path
+    GUI_ROTATIONT_DIR: Path
+    GUI_COMPOSITE_DIR: Path
+    GUI_RHOHV_DIR: Path
+    GUI_PRECIPTYP_DIR: Path
+    GUI_MAP_DIR: Path
+    GUI_MANIFEST_JSON: Path
+
+    @classmethod
+    def from_base(cls, base_dir):
+        """Builds the full path set under base_dir."""
+        base_dir = Path(base_dir)
+        data_dir = base_dir / "data"
+        gui_dir = base_dir / "gui"
+        return cls(
+            BASE_DIR=base_dir,
+            # ---------- PATH CONFIG ----------
+            DATA_DIR=data_dir,
+            MRMS_RALA_DIR=data_dir / "RALA",
+            MRMS_CGFLASH_DIR=data_dir / "NLDN",
+            MRMS_NLDN_DIR=data_dir / "NLDN_Density",
+            MRMS_ECHOTOP18_DIR=data_dir / "EchoTop18",
+            MRMS_ECHOTOP30_DIR=data_dir / "EchoTop30",
+            MRMS_QPE_DIR=data_dir / "QPE_01H",
+            MRMS_RAIN_DIR=data_dir / "WarmRainProbability",
+            MRMS_PRECIPRATE_DIR=data_dir / "PrecipRate",
+            MRMS_PROBSEVERE_DIR=data_dir / "ProbSevere",
+            MRMS_FLASH_DIR=data_dir / "FLASH",
+            MRMS_VIL_DIR=data_dir / "VILDensity",
+            MRMS_VII_DIR=data_dir / "VII",
+            MRMS_ROTATIONT_DIR=data_dir / "RotationTrack30min",
+            MRMS_COMPOSITE_DIR=data_dir / "CompRefQC",
+            MRMS_RHOHV_DIR=data_dir / "RhoHV",
+            MRMS_PRECIPTYP_DIR=data_dir / "PrecipFlag",
+            MRMS_MESH_DIR=data_dir / "MESH",
+            MRMS_AZSHEARLOW_DIR=data_dir / "AzShearLow",
+            MRMS_AZSHEARMID_DIR=data_dir / "AzShearMid",
+            GOES_GLM_DIR=data_dir / "GLM",
+            STORMCELL_JSON=data_dir / "stormcells.json",
+            WPC_SFC_DIR=base_dir / "wpc" / "surface_analysis",
+            # ---------- GUI PATH CONFIG ----------
+            GUI_DIR=gui_dir,
+            GUI_RALA_DIR=gui_dir / "RALA",
+            GUI_NLDN_DIR=gui_dir / "NLDN",
+            GUI_ECHOTOP18_DIR=gui_dir / "EchoTop18",
+            GUI_ECHOTOP30_DIR=gui_dir / "EchoTop30",
+            GUI_QPE_DIR=gui_dir / "QPE_01H",
+            GUI_AZSHEARLOW_DIR=gui_dir / "AzShearLow",
+            GUI_AZSHEARMID_DIR=gui_dir / "AzShearMid",
+            GUI_PRECIPRATE_DIR=gui_dir / "PrecipRate",
+            GUI_PROBSEVERE_DIR=gui_dir / "ProbSevere",
+            GUI_FLASH_DIR=gui_dir / "FLASH",
+            GUI_VIL_DIR=gui_dir / "VILDensity",
+            GUI_VII_DIR=gui_dir / "VII",
+            GUI_ROTATIONT_DIR=gui_dir / "RotationTrack30min",
+            GUI_COMPOSITE_DIR=gui_dir / "CompRefQC",
+            GUI_RHOHV_DIR=gui_dir / "RhoHV",
+            GUI_PRECIPTYP_DIR=gui_dir / "PrecipFlag",
+            GUI_MAP_DIR=gui_dir / "maps",
+            GUI_MANIFEST_JSON=gui_dir / "overlay_manifest.json",
+        )
+
 def set_base_dir(path):
     """
     Dynamically update the base directory and all derived paths.
@@ -27,17 +131,7 @@ def set_base_dir(path):
     Args:
         path (str or Path): New base directory path
     """
-    global BASE_DIR, DATA_DIR, GUI_DIR
-    global MRMS_RALA_DIR, MRMS_CGFLASH_DIR, MRMS_NLDN_DIR, MRMS_ECHOTOP18_DIR
-    global MRMS_ECHOTOP30_DIR, MRMS_QPE_DIR, MRMS_RAIN_DIR, MRMS_PRECIPRATE_DIR
-    global MRMS_PROBSEVERE_DIR, MRMS_FLASH_DIR, MRMS_VIL_DIR, MRMS_VII_DIR
-    global MRMS_ROTATIONT_DIR, MRMS_COMPOSITE_DIR, MRMS_RHOHV_DIR, MRMS_PRECIPTYP_DIR
-    global MRMS_MESH_DIR, MRMS_AZSHEARLOW_DIR, MRMS_AZSHEARMID_DIR, GOES_GLM_DIR, STORMCELL_JSON
-    global GUI_RALA_DIR, GUI_NLDN_DIR, GUI_ECHOTOP18_DIR, GUI_ECHOTOP30_DIR
-    global GUI_QPE_DIR, GUI_PRECIPRATE_DIR, GUI_PROBSEVERE_DIR, GUI_FLASH_DIR
-    global GUI_VIL_DIR, GUI_VII_DIR, GUI_ROTATIONT_DIR, GUI_COMPOSITE_DIR
-    global GUI_RHOHV_DIR, GUI_PRECIPTYP_DIR, GUI_MAP_DIR, GUI_MANIFEST_JSON
-    global WPC_SFC_DIR, MRMS_AZSHEARLOW_DIR, MRMS_AZSHEARMID_DIR  # [NEW]
+    global BASE_DIR
     
     BASE_DIR = Path(path)
     io_manager.write_info(f"Base directory updated to: {BASE_DIR}")
@@ -47,76 +141,26 @@ def set_base_dir(path):
 
 def _init_paths():
     """Initialize all path variables based on current BASE_DIR."""
-    global DATA_DIR, GUI_DIR
-    global MRMS_RALA_DIR, MRMS_CGFLASH_DIR, MRMS_NLDN_DIR, MRMS_ECHOTOP18_DIR
-    global MRMS_ECHOTOP30_DIR, MRMS_QPE_DIR, MRMS_RAIN_DIR, MRMS_PRECIPRATE_DIR
-    global MRMS_PROBSEVERE_DIR, MRMS_FLASH_DIR, MRMS_VIL_DIR, MRMS_VII_DIR
-    global MRMS_ROTATIONT_DIR, MRMS_COMPOSITE_DIR, MRMS_RHOHV_DIR, MRMS_PRECIPTYP_DIR
-    global MRMS_MESH_DIR, MRMS_AZSHEARLOW_DIR, MRMS_AZSHEARMID_DIR, GOES_GLM_DIR, STORMCELL_JSON
-    global GUI_RALA_DIR, GUI_NLDN_DIR, GUI_ECHOTOP18_DIR, GUI_ECHOTOP30_DIR
-    global GUI_QPE_DIR, GUI_PRECIPRATE_DIR, GUI_PROBSEVERE_DIR, GUI_FLASH_DIR
-    global GUI_VIL_DIR, GUI_VII_DIR, GUI_ROTATIONT_DIR, GUI_COMPOSITE_DIR
-    global GUI_RHOHV_DIR, GUI_PRECIPTYP_DIR, GUI_MAP_DIR, GUI_MANIFEST_JSON
-    global WPC_SFC_DIR, GUI_AZSHEARLOW_DIR, GUI_AZSHEARMID_DIR  # [NEW]
-    
-    # ---------- PATH CONFIG ----------
-    DATA_DIR = BASE_DIR / "data"
-    MRMS_RALA_DIR = DATA_DIR / "RALA"
-    MRMS_CGFLASH_DIR = DATA_DIR / "NLDN"
-    MRMS_NLDN_DIR = DATA_DIR / "NLDN_Density"
-    MRMS_ECHOTOP18_DIR = DATA_DIR / "EchoTop18"
-    MRMS_ECHOTOP30_DIR = DATA_DIR / "EchoTop30"
-    MRMS_QPE_DIR = DATA_DIR / "QPE_01H"
-    MRMS_RAIN_DIR = DATA_DIR / "WarmRainProbability"
-    MRMS_PRECIPRATE_DIR = DATA_DIR / "PrecipRate"
-    MRMS_PROBSEVERE_DIR = DATA_DIR / "ProbSevere"
-    MRMS_FLASH_DIR = DATA_DIR / "FLASH"
-    MRMS_VIL_DIR = DATA_DIR / "VILDensity"
-    MRMS_VII_DIR = DATA_DIR / "VII"
-    MRMS_ROTATIONT_DIR = DATA_DIR / "RotationTrack30min"
-    MRMS_COMPOSITE_DIR = DATA_DIR / "CompRefQC"
-    MRMS_RHOHV_DIR = DATA_DIR / "RhoHV"
-    MRMS_PRECIPTYP_DIR = DATA_DIR / "PrecipFlag"
-    MRMS_MESH_DIR = DATA_DIR / "MESH"
-    MRMS_AZSHEARLOW_DIR = DATA_DIR / "AzShearLow"
-    MRMS_AZSHEARMID_DIR = DATA_DIR / "AzShearMid"
-    GOES_GLM_DIR = DATA_DIR / "GLM"
-    STORMCELL_JSON = DATA_DIR / "stormcells.json"
-    
-    WPC_SFC_DIR = BASE_DIR / "wpc" / "surface_analysis"  # [NEW]
-    
-    # ---------- GUI PATH CONFIG ----------
-    GUI_DIR = BASE_DIR / "gui"
-    GUI_RALA_DIR = GUI_DIR / "RALA"
-    GUI_NLDN_DIR = GUI_DIR / "NLDN"
-    GUI_ECHOTOP18_DIR = GUI_DIR / "EchoTop18"
-    GUI_ECHOTOP30_DIR = GUI_DIR / "EchoTop30"
-    GUI_QPE_DIR = GUI_DIR / "QPE_01H"
-    GUI_AZSHEARLOW_DIR = GUI_DIR / "AzShearLow"
-    GUI_AZSHEARMID_DIR = GUI_DIR / "AzShearMid"
-    GUI_PRECIPRATE_DIR = GUI_DIR / "PrecipRate"
-    GUI_PROBSEVERE_DIR = GUI_DIR / "ProbSevere"
-    GUI_FLASH_DIR = GUI_DIR / "FLASH"
-    GUI_VIL_DIR = GUI_DIR / "VILDensity"
-    GUI_VII_DIR = GUI_DIR / "VII"
-    GUI_ROTATIONT_DIR = GUI_DIR / "RotationTrack30min"
-    GUI_COMPOSITE_DIR = GUI_DIR / "CompRefQC"
-    GUI_RHOHV_DIR = GUI_DIR / "RhoHV"
-    GUI_PRECIPTYP_DIR = GUI_DIR / "PrecipFlag"
-    GUI_MAP_DIR = GUI_DIR / "maps"
-    GUI_MANIFEST_JSON = GUI_DIR / "overlay_manifest.json"
+    global paths, _BASE_DIR_RESOLVED
+
+    # Swapped in as one object, so readers of `paths` never see a half-updated set
+    paths = Paths.from_base(BASE_DIR)
+
+    # Resolved once per BASE_DIR change for the clean_old_files safety check
+    _BASE_DIR_RESOLVED = BASE_DIR.resolve()
 
 # Initialize paths on module load
 _init_paths()
 
 # ---------- COLORMAP JSON LOOKUP ----------
+@cache
 def _find_colormap_json():
     """Locate colormaps.json in sensible locations."""
     candidates = [
         Path.cwd() / "colormaps.json",
         Path(__file__).resolve().parents[1] / "colormaps.json",  # EWMRS/colormaps.json
         Path(__file__).resolve().parents[2] / "colormaps.json",  # repo root/colormaps.json
-        GUI_DIR / "colormaps.json",
+        paths.GUI_DIR / "colormaps.json",
     ]
     
     for candidate in candidates:
@@ -127,7 +171,32 @@ def _find_colormap_json():
     io_manager.write_warning("colormaps.json not found in common locations; using relative path 'colormaps.json'")
     return Path("colormaps.json")
 
-GUI_COLORMAP_JSON = _find_colormap_json()
+_PATH_FIELDS = frozenset(Paths.__dataclass_fields__)
+
+def __getattr__(name):
+    # GUI_COLORMAP_JSON is located on first access (PEP 562) instead of at import,
+    # so importing this module for non-GUI work skips the filesystem probes
+    if name == "GUI_COLORMAP_JSON":
+        return _find_colormap_json()
+    # Legacy `fs.MRMS_RALA_DIR`-style lookups read the current `paths`; it is the
+    # only copy, so they follow set_base_dir() (new code should use fs.paths directly)
+    if name in _PATH_FIELDS:
+        return getattr(paths, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ---------- JSON CODEC ----------
+# Bytes-in/bytes-out JSON for files written on every render (index.json) or parsed at
+# import (colormaps.json). orjson is used when installed; the stdlib fallback emits the
+# same compact, UTF-8 output, so the files look the same either way
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
 
 
 # ---------- FILE UTILITIES ----------
@@ -143,13 +212,19 @@ def latest_files(dir, n):
     if not dir.exists():
         io_manager.write_warning(f"{dir} doesn't exist!")
         return
-    files = sorted(
-        [f for f in dir.glob("*") if f.is_file() and f.suffix.lower() != ".idx"],
-        key=lambda f: f.stat().st_mtime
-    )
+    # One scandir pass: is_file() comes from the directory listing and each entry is stat()ed once
+    with os.scandir(dir) as it:
+        files = sorted(
+            (
+                (entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() != ".idx"
+            ),
+            key=lambda f: f[0]
+        )
     if len(files) < n:
         raise RuntimeError(f"Not enough files in {dir}")
-    return [str(f) for f in files[-n:]]
+    return [path for _, path in files[-n:]]
 
 def clean_idx_files(folders):
     """
@@ -181,9 +256,9 @@ def clean_idx_files(folders):
 def clean_old_files(directory: Path, max_age_minutes=60):
     # Safety Check: Ensure directory is within BASE_DIR
     try:
-        # resolve() handles symlinks and . and .. components
+        # resolve() handles symlinks and . and .. components (BASE_DIR's is cached by _init_paths)
         # is_relative_to (Python 3.9+) checks if BASE_DIR is a parent of directory
-        if not directory.resolve().is_relative_to(BASE_DIR.resolve()):
+        if not directory.resolve().is_relative_to(_BASE_DIR_RESOLVED):
              io_manager.write_error(f"SAFETY ERROR: Attempting to clean {directory} which is not inside {BASE_DIR}")
              return
     except Exception as e:
@@ -194,19 +269,21 @@ def clean_old_files(directory: Path, max_age_minutes=60):
     now = datetime.now().timestamp()
     cutoff = now - (max_age_minutes * 60)
     files_deleted = 0
-    kept_files = []
-
-    for f in directory.glob("*"):
-        if f.is_file():
-            try:
-                mtime = f.stat().st_mtime
-                if mtime < cutoff:
-                    f.unlink()
-                    files_deleted += 1
-                else:
-                    kept_files.append((f, mtime))
-            except Exception as e:
-                io_manager.write_error(f"Could not process/delete {f.name}: {e}")
+
+    # One scandir pass; is_file() comes from the directory listing, one stat() per file
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        files_deleted += 1
+                except Exception as e:
+                    io_manager.write_error(f"Could not process/delete {entry.name}: {e}")
+    except FileNotFoundError:
+        return
 
     if files_deleted > 0:
         io_manager.write_debug(f"Deleted {files_deleted} files in {directory}")
\ No newline at end of file
@@ -6,22 +6,43 @@ import cfgrib
 import netCDF4
 import json
 import re
+from functools import lru_cache
+
+# Optional dask: datasets are opened chunked so no variable data is read before subsetting
+# (xarray's own lazy backend arrays are used when it is missing)
+try:
+    import dask  # noqa: F401
+    _OPEN_CHUNKS = {}
+except ImportError:
+    _OPEN_CHUNKS = None
+
+# One search for both formats:
+# MRMS: YYYYMMDD[-_]HHMMSS (groups 1-2), checked by a lookahead anchored at the start so
+#       it wins anywhere in the name, like the old MRMS-then-GOES search order
+# GOES: sYYYYDDDHHMMSST (groups 3-7; T = tenths of second, ignored for dt)
+_TIMESTAMP_PATTERN = re.compile(
+    r"^(?=.*?(\d{8})[-_](\d{6}))"
+    r"|s(\d{4})(\d{3})(\d{2})(\d{2})(\d{2})\d"
+)
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(fname):
+    """Naive datetime parsed from a file name, or None. Cached: the same names are re-scanned every cycle."""
+    m = _TIMESTAMP_PATTERN.search(fname)
+    if m is None:
+        return None
+
+    if m.group(1) is not None:
+        return datetime.strptime(f"{m.group(1)}{m.group(2)}", "%Y%m%d%H%M%S")
+
+    y, d, h, mn, s = map(int, m.group(3, 4, 5, 6, 7))
+    return datetime(y, 1, 1, h, mn, s) + timedelta(days=d-1)
 
 def extract_timestamp(filepath, use_timezone_utc=False, round_to_minute=False, isoformat=False):
     """
     Compact timestamp extractor for MRMS (YYYYMMDD_HHMMSS) and GOES (sYYYYDDDHHMMSST).
     """
-    fname = Path(filepath).name
-    dt = None
-
-    # MRMS: YYYYMMDD[-_]HHMMSS
-    if m := re.search(r"(\d{8})[-_](\d{6})", fname):
-        dt = datetime.strptime(f"{m.group(1)}{m.group(2)}", "%Y%m%d%H%M%S")
-    
-    # GOES: sYYYYDDDHHMMSST (T = tenths of second, ignored for dt)
-    elif m := re.search(r"s(\d{4})(\d{3})(\d{2})(\d{2})(\d{2})(\d{1})", fname):
-        y, d, h, mn, s, _ = map(int, m.groups())
-        dt = datetime(y, 1, 1, h, mn, s) + timedelta(days=d-1)
+    dt = _parse_timestamp(Path(filepath).name)
 
     if not dt: return None
 
@@ -67,7 +88,7 @@ class FileHandler:
         if filepath.endswith(".grib2"):
             self.io.write_info(f"Loading GRIB file from {filepath}")
             try:
-                ds = xr.open_dataset(filepath, engine="cfgrib", decode_timedelta=True)
+                ds = xr.open_dataset(filepath, engine="cfgrib", decode_timedelta=True, chunks=_OPEN_CHUNKS)
                 self.io.write_debug(f"Loaded GRIB file from {filepath}")
             except Exception as e:
                 self.io.write_error(f"Failed to load GRIB file: {e}")
@@ -76,7 +97,7 @@ class FileHandler:
         elif filepath.endswith(".nc"):
             self.io.write_info(f"Loading netCDF file from {filepath}")
             try:
-                ds = xr.open_dataset(filepath, engine="netcdf4", decode_timedelta=True)
+                ds = xr.open_dataset(filepath, engine="netcdf4", decode_timedelta=True, chunks=_OPEN_CHUNKS)
                 self.io.write_debug(f"Loaded netCDF file from {filepath}")
             except Exception as e:
                 self.io.write_error(f"Failed to load netCDF file: {e}")
@@ -103,14 +124,19 @@ class FileHandler:
             lat_name = "latitude" if "latitude" in ds.coords else "lat"
             lon_name = "longitude" if "longitude" in ds.coords else "lon"
             
-            if ds[lat_name][0] > ds[lat_name][-1]:
+            # Read from the pandas indexes xarray keeps for coordinates (plain scalars,
+            # no DataArray wrapping or backend reads)
+            lat_index = ds.indexes[lat_name]
+            lon_index = ds.indexes[lon_name]
+
+            if lat_index[0] > lat_index[-1]:
                 lat_slice = slice(lat_limits[1], lat_limits[0])
             else:
                 lat_slice = slice(lat_limits[0], lat_limits[1])
             
             # Handle longitude wrapping (0-360 vs -180-180)
-            ds_lon_min = float(ds[lon_name].min())
-            ds_lon_max = float(ds[lon_name].max())
+            ds_lon_min = float(lon_index.min())
+            ds_lon_max = float(lon_index.max())
             
             l_min, l_max = lon_limits
             
@@ -130,7 +156,8 @@ class FileHandler:
 
             lon_slice = slice(l_min, l_max)
             
-            ds = ds.sel({lat_name: lat_slice, lon_name: lon_slice})
+            # Select first, then read only the window into memory once
+            ds = ds.sel({lat_name: lat_slice, lon_name: lon_slice}).load()
             self.io.write_debug(f"Subset dataset to lat: {lat_limits}, lon: {lon_limits} (adjusted to {l_min:.2f}, {l_max:.2f})")
             return ds
         except Exception as e:
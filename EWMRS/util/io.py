@@ -1,6 +1,26 @@
 from datetime import datetime, timezone
 import argparse
+import logging
+import os
 import sys
+import time
+
+# Date/time part of the last log timestamp, reformatted only when the second changes
+# Stored as one (second, "YYYY-MM-DDTHH:MM:SS") tuple so concurrent writers never see a torn pair
+_ts_cache = (None, "")
+
+def _utc_timestamp():
+    """Same string as datetime.now(timezone.utc).isoformat(), cached per second."""
+    global _ts_cache
+    t = time.time()
+    sec = int(t)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _ts_cache = (sec, prefix)
+    usec = int((t - sec) * 1_000_000)
+    # isoformat() omits the fraction when it is exactly zero
+    return f"{prefix}.{usec:06d}+00:00" if usec else f"{prefix}+00:00"
 
 class TimestampedOutput:
     def __init__(self, stream):
@@ -8,7 +28,7 @@ class TimestampedOutput:
 
     def write(self, message):
         if message.strip():  # skip empty lines
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = _utc_timestamp()
             self.stream.write(f"[{timestamp}] {message}")
         else:
             self.stream.write(message)
@@ -22,15 +42,47 @@ class QueueWriter:
 
     def write(self, message):
         if message.strip():
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = _utc_timestamp()
             self.queue.put(f"[{timestamp}] {message}")
 
     def flush(self):
         pass
 
+class _PrintHandler(logging.Handler):
+    """Emits through print() so records follow whatever sys.stdout currently is (TimestampedOutput, QueueWriter)."""
+
+    def emit(self, record):
+        try:
+            print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+class _HeaderFormatter(logging.Formatter):
+    """Formats records the way IOManager always printed them: "<header> <LEVEL>: <msg>"."""
+    _LABELS = {logging.WARNING: "WARN"}
+
+    def format(self, record):
+        header = record.name[len(_LOGGER_NAME) + 1:]
+        label = self._LABELS.get(record.levelno, record.levelname)
+        return f"{header} {label}: {record.getMessage()}"
+
+# Parent logger for every IOManager; level comes from EWMRS_LOG_LEVEL (e.g. INFO, WARN)
+# and defaults to DEBUG, which prints everything as before
+_LOGGER_NAME = "EWMRS"
+_logger = logging.getLogger(_LOGGER_NAME)
+if not _logger.handlers:
+    _level = getattr(logging, os.environ.get("EWMRS_LOG_LEVEL", "DEBUG").upper(), None)
+    _logger.setLevel(_level if isinstance(_level, int) else logging.DEBUG)
+    _handler = _PrintHandler()
+    _handler.setFormatter(_HeaderFormatter())
+    _logger.addHandler(_handler)
+    _logger.propagate = False
+
 class IOManager:
     def __init__(self, header):
         self.header = header
+        # Disabled levels return from isEnabledFor() without formatting or printing anything
+        self.log = logging.getLogger(f"{_LOGGER_NAME}.{header}")
     
     @staticmethod
     def get_base_dir_arg():
@@ -92,17 +144,13 @@ class IOManager:
         return args
     
     def write_info(self, msg):
-        print(f"{self.header} INFO: {msg}")
-        return
+        self.log.info(msg)
 
     def write_debug(self, msg):
-        print(f"{self.header} DEBUG: {msg}")
-        return
+        self.log.debug(msg)
 
     def write_warning(self, msg):
-        print(f"{self.header} WARN: {msg}")
-        return
+        self.log.warning(msg)
 
     def write_error(self, msg):
-        print(f"{self.header} ERROR: {msg}")
-        return
\ No newline at end of file
+        self.log.error(msg)
\ No newline at end of file
@@ -1,18 +1,92 @@
 
+import os
 import unittest
 import numpy as np
 import xarray as xr
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Progress output is opt-in: EWMRS_VERBOSE_TESTS=1 python -m unittest tests/verify_downsampling.py
+VERBOSE = bool(os.environ.get("EWMRS_VERBOSE_TESTS"))
+
+
+def _report(*args):
+    if VERBOSE:
+        print(*args)
+
+
+# Optional Numba reference kernel for scaled-up grids; its test is skipped when missing
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Optional compiled reduction backend for xarray; its test is skipped when missing
+try:
+    import numbagg  # noqa: F401
+    _HAVE_NUMBAGG = True
+except ImportError:
+    _HAVE_NUMBAGG = False
+
+
+def _block_max_2x2(arr):
+    """Max over non-overlapping 2x2 blocks (plain NumPy equivalent of coarsen(2, 2).max())."""
+    return arr.reshape(arr.shape[0] // 2, 2, arr.shape[1] // 2, 2).max(axis=(1, 3))
+
+
+def _block_max_2x2_strided(arr):
+    """
+    Same result as _block_max_2x2 from two np.maximum passes over strided views.
+
+    Vectorized ufunc loop with no reshape; NaN propagates exactly as with max().
+    """
+    return np.maximum(np.maximum(arr[0::2, 0::2], arr[0::2, 1::2]),
+                      np.maximum(arr[1::2, 0::2], arr[1::2, 1::2]))
+
+
+def _block_max_2x2_windows(arr):
+    """Same result again, reducing a zero-copy (H/2, W/2, 2, 2) view of the blocks."""
+    return sliding_window_view(arr, (2, 2))[::2, ::2].max(axis=(-2, -1))
+
+
+if _HAVE_NUMBA:
+    # fastmath is left off: it would let max() ignore NaN ordering. No cache=True either:
+    # this file is imported both as verify_downsampling and tests.verify_downsampling,
+    # and numba cannot reload a cached kernel under the other module name
+    @njit(parallel=True)
+    def _coarsen_max_numba(a, out):
+        """2x2 block max, one output row per parallel iteration."""
+        for i in prange(out.shape[0]):
+            for j in range(out.shape[1]):
+                a0 = a[2 * i, 2 * j]
+                a1 = a[2 * i, 2 * j + 1]
+                a2 = a[2 * i + 1, 2 * j]
+                a3 = a[2 * i + 1, 2 * j + 1]
+                out[i, j] = max(max(a0, a1), max(a2, a3))
+
+    def _block_max_2x2_numba(arr):
+        out = np.empty((arr.shape[0] // 2, arr.shape[1] // 2), dtype=arr.dtype)
+        _coarsen_max_numba(arr, out)
+        return out
+
+    # Compile once at import so no test pays the JIT cost
+    _block_max_2x2_numba(np.zeros((2, 2), dtype=np.float32))
 
 class TestAzShearDownsampling(unittest.TestCase):
-    def setUp(self):
+    # Grid sizes for test_coarsen_scales, up to the 3500x7000 MRMS CONUS grid
+    SCALE_SHAPES = ((4, 4), (512, 1024), (3500, 7000))
+
+    @classmethod
+    def setUpClass(cls):
+        # Built once for the whole class and shared by every test
         # Create a synthetic 0.005 degree grid
         # Let's say we have a 4x4 grid (small scale test)
         # Latitudes: 20.0175, 20.0125, 20.0075, 20.0025 (descending like GRIB)
         # Longitudes: 230.0025, 230.0075, 230.0125, 230.0175 (ascending)
         
-        self.lats = np.array([20.0175, 20.0125, 20.0075, 20.0025])
-        self.lons = np.array([230.0025, 230.0075, 230.0125, 230.0175])
+        cls.lats = np.array([20.0175, 20.0125, 20.0075, 20.0025])
+        cls.lons = np.array([230.0025, 230.0075, 230.0125, 230.0175])
         
         # Create data with specific hotspots
         # We want to verify that the MAX value in a 2x2 block is preserved
@@ -21,7 +95,8 @@ class TestAzShearDownsampling(unittest.TestCase):
         # Target Output Lat: Mean(20.0175, 20.0125) = 20.015
         # Target Output Lon: Mean(230.0025, 230.0075) = 230.005
         
-        data = np.zeros((4, 4))
+        # float32 like the decoded AzShear grids; coordinates stay float64
+        data = np.zeros((4, 4), dtype=np.float32)
         
         # Set a peak in Block 1
         data[0, 0] = 10.0 # Peak
@@ -35,51 +110,119 @@ class TestAzShearDownsampling(unittest.TestCase):
         data[3, 2] = 8.0 # Peak
         data[3, 3] = 6.0
         
-        self.ds = xr.Dataset(
-            data_vars=dict(
-                unknown=(["latitude", "longitude"], data)
-            ),
-            coords=dict(
-                latitude=self.lats,
-                longitude=self.lons
-            )
+        # Read-only so a test cannot silently modify the shared fixture
+        for arr in (cls.lats, cls.lons, data):
+            arr.flags.writeable = False
+
+        # A bare DataArray: coarsen() reduces each Dataset variable the same way
+        cls.da = xr.DataArray(
+            data,
+            dims=("latitude", "longitude"),
+            coords={"latitude": cls.lats, "longitude": cls.lons},
+            name="unknown"
         )
         
-        print("Setup synthetic dataset with shape:", self.ds['unknown'].shape)
+        cls.data = data
+        _report("Setup synthetic grid with shape:", data.shape)
 
-    def test_coarsen_max_preserves_peaks(self):
-        print("\nRunning coarsen().max() transformation...")
-        
-        # APPLY THE LOGIC
+        # APPLY THE LOGIC (as in ewmrs.py), once for every test that compares against it
         # lat step is approx 0.005. coarsen=2 makes it 0.01
         # coord_func='mean' centers the new pixel
-        downsampled_ds = self.ds.coarsen(latitude=2, longitude=2, boundary='trim', coord_func='mean').max()
-        
-        print("Output shape:", downsampled_ds['unknown'].shape)
-        
+        _report("Running coarsen().max() transformation...")
+        coarsened = cls.da.coarsen(latitude=2, longitude=2, boundary='trim', coord_func='mean').max().load()
+        cls.coarsened_values = coarsened.values
+        cls.coarsened_lats = coarsened.latitude.values
+        cls.coarsened_lons = coarsened.longitude.values
+
+        # One buffer at the full CONUS grid size, sliced per shape by test_coarsen_scales
+        # (np.zeros is lazily zeroed, so tests that don't use it don't pay for it)
+        cls._big = np.zeros(cls.SCALE_SHAPES[-1], dtype=np.float32)
+
+    def test_coarsen_max_preserves_peaks(self):
+        _report("\nRunning 2x2 block max on the raw array...")
+
+        out = _block_max_2x2(self.data)
+
+        # coord_func='mean' centers the new pixel: the mean of each coordinate pair
+        out_lats = self.lats.reshape(-1, 2).mean(1)
+        out_lons = self.lons.reshape(-1, 2).mean(1)
+
+        _report("Output shape:", out.shape)
+
         # Verify Shape
-        self.assertEqual(downsampled_ds['unknown'].shape, (2, 2))
-        
+        self.assertEqual(out.shape, (2, 2))
+        self.assertEqual(out.dtype, np.float32)
+
         # Verify Coordinates (Alignment with MRMS Standard Grid)
         # Expected Lats: 20.015, 20.005
         # Expected Lons: 230.005, 230.015
-        
+
         expected_lats = np.array([20.015, 20.005])
         expected_lons = np.array([230.005, 230.015])
-        
-        np.testing.assert_allclose(downsampled_ds.latitude.values, expected_lats, atol=1e-5)
-        np.testing.assert_allclose(downsampled_ds.longitude.values, expected_lons, atol=1e-5)
-        print("Coordinates aligned correctly.")
-        
+
+        np.testing.assert_allclose(out_lats, expected_lats, atol=1e-5)
+        np.testing.assert_allclose(out_lons, expected_lons, atol=1e-5)
+        _report("Coordinates aligned correctly.")
+
         # Verify Values (Peak Preservation)
-        # Block 1 Max should be 10.0
-        self.assertEqual(downsampled_ds['unknown'].values[0, 0], 10.0)
-        
-        # Block 4 Max should be 8.0
-        self.assertEqual(downsampled_ds['unknown'].values[1, 1], 8.0)
-        
-        print("Peaks preserved correctly.")
-        print("Verification SUCCESS.")
+        # Block 1 Max should be 10.0, Block 4 Max should be 8.0; the other blocks are all zero
+        expected = np.array([[10.0, 0.0],
+                             [0.0, 8.0]], dtype=np.float32)
+        np.testing.assert_array_equal(out, expected)
+
+        _report("Peaks preserved correctly.")
+        _report("Verification SUCCESS.")
+
+    def test_xarray_coarsen_matches_block_max(self):
+        np.testing.assert_array_equal(self.coarsened_values, _block_max_2x2(self.data))
+        np.testing.assert_array_equal(self.coarsened_values, _block_max_2x2_strided(self.data))
+        np.testing.assert_allclose(self.coarsened_lats, self.lats.reshape(-1, 2).mean(1))
+        np.testing.assert_allclose(self.coarsened_lons, self.lons.reshape(-1, 2).mean(1))
+        _report("xarray coarsen matches the NumPy block max.")
+
+    def test_window_view_matches_coarsen(self):
+        np.testing.assert_array_equal(_block_max_2x2_windows(self.data), self.coarsened_values)
+
+        # The window view must also hold for inputs that are not C-contiguous
+        transposed = np.ascontiguousarray(self.data.T).T
+        np.testing.assert_array_equal(_block_max_2x2_windows(transposed), self.coarsened_values)
+
+    def test_coarsen_scales(self):
+        for shape in self.SCALE_SHAPES:
+            with self.subTest(shape=shape):
+                h, w = shape
+                view = self._big[:h, :w]
+                view[...] = 0
+
+                # Give every block a distinct peak, cycling it through the four block corners
+                expected = np.arange(1, h * w // 4 + 1, dtype=np.float32).reshape(h // 2, w // 2)
+                corner = np.arange(expected.size).reshape(expected.shape) % 4
+                for c, (di, dj) in enumerate(((0, 0), (0, 1), (1, 0), (1, 1))):
+                    mask = corner == c
+                    view[di::2, dj::2][mask] = expected[mask]
+
+                da = xr.DataArray(view, dims=("latitude", "longitude"))
+                out = da.coarsen(latitude=2, longitude=2, boundary='trim').max()
+                np.testing.assert_array_equal(out.values, expected)
+                np.testing.assert_array_equal(_block_max_2x2(view), expected)
+                np.testing.assert_array_equal(_block_max_2x2_strided(view), expected)
+                np.testing.assert_array_equal(_block_max_2x2_windows(view), expected)
+                if _HAVE_NUMBA:
+                    np.testing.assert_array_equal(_block_max_2x2_numba(view), expected)
+
+    @unittest.skipIf(not _HAVE_NUMBAGG, "numbagg is not installed")
+    def test_numbagg_coarsen_matches_default(self):
+        with xr.set_options(use_numbagg=True):
+            out = self.da.coarsen(latitude=2, longitude=2, boundary='trim', coord_func='mean').max()
+        np.testing.assert_array_equal(out.values, self.coarsened_values)
+
+    @unittest.skipIf(not _HAVE_NUMBA, "numba is not installed")
+    def test_numba_block_max_matches_numpy(self):
+        np.testing.assert_array_equal(_block_max_2x2_numba(self.data), _block_max_2x2(self.data))
+
+        # Reference check on a scaled-up grid, where the kernel is meant to be used
+        big = np.random.default_rng(0).standard_normal((512, 1024), dtype=np.float32)
+        np.testing.assert_array_equal(_block_max_2x2_numba(big), _block_max_2x2(big))
 
 if __name__ == '__main__':
     unittest.main()
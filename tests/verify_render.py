@@ -0,0 +1,133 @@
+
+import json
+import struct
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+import numpy as np
+
+from EWMRS.render import render
+
+
+class TestColormapLookup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Any interpolated colormap will do; its LUT has a transparent row 0
+        cls.cmap = next(c for c in render._COLORMAPS.values() if c[2])
+        thresholds, _, _, cls.lut = cls.cmap
+        cls.vmin = thresholds[0]
+        cls.scale = np.float32((render._LUT_SIZE - 1) / (thresholds[-1] - thresholds[0]))
+
+        f32 = np.finfo(np.float32)
+        edge_values = np.array([np.nan, np.inf, -np.inf, f32.max, -f32.max, 1e20, 1e30, -1e20,
+                                cls.vmin, thresholds[-1], 0.0], dtype=np.float32)
+        grid = np.random.default_rng(0).uniform(thresholds[0] - 10, thresholds[-1] + 10, 100_000)
+        cls.values = np.concatenate([edge_values, grid.astype(np.float32)])
+
+    def _numpy_rgba(self):
+        # float32.max * scale overflows to inf on purpose
+        with np.errstate(over='ignore'):
+            indices = render._lut_indices(self.values, self.vmin, self.scale)
+        return np.take(self.lut, indices, axis=0, mode='clip')
+
+    def test_numpy_path_edge_values(self):
+        rgba = self._numpy_rgba()
+        # NaN and anything below the first threshold are transparent
+        np.testing.assert_array_equal(rgba[[0, 2, 4, 7], 3], 0)
+        # +inf and huge finite values saturate to the last (opaque) colour
+        for i in (1, 3, 5, 6):
+            np.testing.assert_array_equal(rgba[i], self.lut[-1])
+
+    @unittest.skipIf(not render._HAVE_NUMBA, "numba is not installed")
+    def test_numba_kernel_matches_numpy(self):
+        out = np.empty((self.values.size, 4), dtype=np.uint8)
+        render._apply_lut_numba(self.values, self.lut, self.vmin, self.scale, out)
+        np.testing.assert_array_equal(out, self._numpy_rgba())
+
+    def test_flat_range_colormap(self):
+        # A single threshold (first == last) gives scale 0 in convert_to_png
+        thresholds, _, interpolate, lut = render._parse_colormap(
+            {"name": "One", "thresholds": [{"value": 5, "rgb": [10, 20, 30]}]})
+        self.assertTrue(interpolate)
+        values = np.array([0.0, 4.9, 5.0, 6.0, np.nan, np.inf, -np.inf], dtype=np.float32)
+        expected_alpha = [0, 0, 255, 255, 0, 255, 0]
+
+        rgba = np.take(lut, render._lut_indices(values, thresholds[0], 0.0), axis=0, mode='clip')
+        np.testing.assert_array_equal(rgba[:, 3], expected_alpha)
+        np.testing.assert_array_equal(rgba[[2, 3, 5], :3], [[10, 20, 30]] * 3)
+
+        if render._HAVE_NUMBA:
+            out = np.empty((values.size, 4), dtype=np.uint8)
+            render._apply_lut_numba(values, lut, thresholds[0], np.float32(0.0), out)
+            np.testing.assert_array_equal(out, rgba)
+
+
+class TestColormapLoading(unittest.TestCase):
+    def tearDown(self):
+        # Drop the override so fs serves the real colormaps.json again, and reload it
+        vars(render.fs).pop("GUI_COLORMAP_JSON", None)
+        render.reload_colormaps()
+
+    def test_malformed_entry_is_skipped(self):
+        colormaps = [{"colormaps": [
+            {"name": "Good", "thresholds": [{"value": 0, "rgb": [0, 0, 0]}, {"value": 1, "rgb": [255, 255, 255]}]},
+            {"name": "MissingValue", "thresholds": [{"rgb": [0, 0, 0]}]},
+            {"name": "BadThresholds", "thresholds": 5},
+            {"name": "Descending", "thresholds": [{"value": 1, "rgb": [0, 0, 0]}, {"value": 0, "rgb": [0, 0, 0]}]},
+        ]}]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "colormaps.json"
+            path.write_text(json.dumps(colormaps))
+            render.fs.GUI_COLORMAP_JSON = path
+            render.reload_colormaps()
+
+        self.assertEqual(list(render._COLORMAPS), ["Good"])
+
+
+def _decode_png_rgba(png_file):
+    """Minimal decoder for the writer's output: RGBA8, one IDAT, filter type 0 on every row."""
+    data = Path(png_file).read_bytes()
+    assert data[:8] == render._PNG_SIGNATURE
+    pos, chunks = 8, {}
+    while pos < len(data):
+        length, = struct.unpack(">I", data[pos:pos + 4])
+        tag = data[pos + 4:pos + 8]
+        body = data[pos + 8:pos + 8 + length]
+        crc, = struct.unpack(">I", data[pos + 8 + length:pos + 12 + length])
+        assert crc == zlib.crc32(body, zlib.crc32(tag)), tag
+        chunks[tag] = body
+        pos += 12 + length
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (depth, color_type) == (8, 6)
+    assert b"IEND" in chunks
+    # zlib.decompress also validates the Adler-32 trailer
+    raw = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, 1 + width * 4)
+    assert not raw[:, 0].any()
+    return raw[:, 1:].reshape(height, width, 4)
+
+
+class TestPngWriter(unittest.TestCase):
+    def test_round_trip(self):
+        rng = np.random.default_rng(0)
+        # Heights below, at and above _PNG_STRIPS, plus a large-ish frame
+        shapes = [(1, 1), (3, 5), (9, 2), (render._PNG_STRIPS, 4), (render._PNG_STRIPS + 1, 3),
+                  (1000, 7), (700, 350)]
+        with tempfile.TemporaryDirectory() as tmp:
+            for shape in shapes:
+                with self.subTest(shape=shape):
+                    rgba = rng.integers(0, 256, size=shape + (4,), dtype=np.uint8)
+                    png_file = Path(tmp) / "out.png"
+                    render._write_png_rgba(png_file, rgba)
+                    np.testing.assert_array_equal(_decode_png_rgba(png_file), rgba)
+
+    def test_empty_image_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for shape in ((0, 5, 4), (5, 0, 4)):
+                with self.subTest(shape=shape):
+                    with self.assertRaises(ValueError):
+                        render._write_png_rgba(Path(tmp) / "out.png", np.zeros(shape, dtype=np.uint8))
+
+
+if __name__ == '__main__':
+    unittest.main()
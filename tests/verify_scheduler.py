@@ -0,0 +1,123 @@
+
+import datetime
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from EWMRS import scheduler
+from EWMRS.util import file as fs
+
+UTC = datetime.timezone.utc
+# Fixed clock so the TTL window cannot roll over between storing and reloading
+NOW = 1_750_000_000.0
+
+
+class _FakeFinder:
+    """Stands in for s3_sync.FileFinder: fixed listing, counts S3 calls."""
+
+    def __init__(self, dt, files, max_entries=scheduler._LOOKUP_DEPTH):
+        self.dt = dt
+        self.max_entries = max_entries
+        self.files = files
+        self.calls = 0
+
+    def lookup_files(self, bucket_path, verbose=False):
+        self.calls += 1
+        return list(self.files)
+
+
+class TestSchedulerDiskCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._tmp.name)
+        patches = (
+            mock.patch.object(fs, "BASE_DIR", self.base_dir),
+            mock.patch.object(scheduler.time, "time", return_value=NOW),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(self._reset)
+        self._reset()
+
+        self.reference_dt = datetime.datetime(2025, 1, 1, 12, 5, 30, tzinfo=UTC)
+        self.files = [
+            ("CONUS/M/20250101/MRMS_M_20250101-120438.grib2.gz", datetime.datetime(2025, 1, 1, 12, 4, 38, tzinfo=UTC)),
+            ("CONUS/M/20250101/MRMS_M_20250101-120236.grib2.gz", datetime.datetime(2025, 1, 1, 12, 2, 36, tzinfo=UTC)),
+        ]
+
+    def _reset(self):
+        """Simulates a freshly started process."""
+        scheduler._DISK_CACHE_LOADED = False
+        scheduler._DISK_CACHE_DIRTY = False
+        scheduler._LOOKUP_CACHE.clear()
+        scheduler._LOCAL_SCAN_CACHE.clear()
+
+    def _store_and_flush(self):
+        finder = _FakeFinder(self.reference_dt, self.files)
+        scheduler._cached_lookup(finder, "CONUS/M/20250101/")
+        self.assertEqual(finder.calls, 1)
+
+        self.local_dir = self.base_dir / "data" / "M"
+        self.local_dir.mkdir(parents=True)
+        (self.local_dir / "MRMS_M_00.50_20250101-120200.grib2").touch()
+        self.local_result = scheduler.MRMSUpdateChecker()._scan_local(self.local_dir)
+
+        scheduler._flush_disk_cache()
+        self.assertTrue((self.base_dir / ".cache" / scheduler._DISK_CACHE_NAME).exists())
+
+    def test_round_trip_in_same_window(self):
+        self._store_and_flush()
+        self._reset()
+        scheduler._load_disk_cache()
+
+        # The listing comes back from disk without another S3 call
+        finder = _FakeFinder(self.reference_dt, [])
+        restored = scheduler._cached_lookup(finder, "CONUS/M/20250101/")
+        self.assertEqual(finder.calls, 0)
+        self.assertEqual(restored, tuple(self.files))
+        for (_, ts), (_, expected) in zip(restored, self.files):
+            self.assertEqual(ts.tzinfo, expected.tzinfo)
+
+        key = os.fspath(self.local_dir)
+        mtime, result = scheduler._LOCAL_SCAN_CACHE[key]
+        self.assertEqual(mtime, os.stat(self.local_dir).st_mtime_ns)
+        self.assertEqual(result, self.local_result)
+        # extract_timestamp returns naive datetimes for local files; that must survive too
+        self.assertEqual(result[1].tzinfo, self.local_result[1].tzinfo)
+
+    def test_stale_window_listing_is_ignored(self):
+        self._store_and_flush()
+        self._reset()
+        with mock.patch.object(scheduler.time, "time", return_value=NOW + scheduler._LOOKUP_TTL):
+            scheduler._load_disk_cache()
+
+        self.assertEqual(len(scheduler._LOOKUP_CACHE), 0)
+        # Local scans are keyed on directory mtime, not the TTL window, so they are kept
+        self.assertIn(os.fspath(self.local_dir), scheduler._LOCAL_SCAN_CACHE)
+
+    def test_corrupt_file_is_ignored(self):
+        cache_file = self.base_dir / ".cache" / scheduler._DISK_CACHE_NAME
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{not json")
+
+        scheduler._load_disk_cache()
+
+        self.assertEqual(len(scheduler._LOOKUP_CACHE), 0)
+        self.assertEqual(len(scheduler._LOCAL_SCAN_CACHE), 0)
+        # Still usable: a lookup goes to S3 as normal
+        finder = _FakeFinder(self.reference_dt, self.files)
+        self.assertEqual(scheduler._cached_lookup(finder, "CONUS/M/20250101/"), tuple(self.files))
+        self.assertEqual(finder.calls, 1)
+
+    def test_flush_without_changes_writes_nothing(self):
+        scheduler._load_disk_cache()
+        scheduler._flush_disk_cache()
+        self.assertFalse((self.base_dir / ".cache").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()